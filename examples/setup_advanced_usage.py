@@ -6,6 +6,11 @@
 - 高级错误处理和恢复
 """
 
+import os
+import re
+import time
+import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -23,6 +28,20 @@ from evan_tools.setup import (
     ProjectConfig,
     PyInstallerBuilder,
 )
+from evan_tools.setup import create_orchestrator as _create_default_orchestrator
+
+# 支持相对目录 fd 删除（unlinkat）的平台
+_SUPPORTS_DIR_FD = (
+    hasattr(os, "fwalk")
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+)
+
+# 本身已经压缩过的格式，再做 DEFLATE 几乎不会变小，直接存储以节省 CPU
+_STORED_SUFFIXES = frozenset({
+    ".zip", ".pyz", ".whl", ".egg", ".gz", ".bz2", ".xz", ".7z",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp3", ".mp4",
+})
 
 
 class CustomLoggingBuilder:
@@ -73,13 +92,15 @@ class ZipDeployer:
     这个示例演示了如何创建一个自定义部署器，将构建输出压缩成 ZIP 文件。
     """
 
-    def __init__(self, zip_path: Optional[Path] = None):
+    def __init__(self, zip_path: Optional[Path] = None, compresslevel: int = 1):
         """初始化 ZIP 部署器
         
         Args:
             zip_path: ZIP 文件输出路径（如果 None，使用项目名称）
+            compresslevel: DEFLATE 压缩级别（1 最快，9 压缩率最高）
         """
         self.zip_path = zip_path
+        self.compresslevel = compresslevel
 
     def deploy(self, config: ProjectConfig) -> DeployResult:
         """执行部署（创建 ZIP 压缩包）
@@ -91,9 +112,6 @@ class ZipDeployer:
             部署结果
         """
         try:
-            import shutil
-            import time
-
             start_time = time.time()
 
             # 确定 ZIP 文件路径
@@ -102,11 +120,7 @@ class ZipDeployer:
             # 创建 ZIP 文件
             output_path = Path(config.output_dir)
             if output_path.exists():
-                shutil.make_archive(
-                    str(zip_path.with_suffix("")),  # 不含 .zip 后缀
-                    "zip",
-                    output_path,
-                )
+                self._write_zip(zip_path, os.fspath(output_path))
 
                 duration = time.time() - start_time
 
@@ -128,6 +142,51 @@ class ZipDeployer:
                 error=str(e),
             )
 
+    def _write_zip(self, zip_path: Path, source_dir: str) -> None:
+        """将目录内容流式写入 ZIP 文件
+
+        成员由 ZipFile 按块读取并压缩，内存占用与文件大小无关；
+        已压缩的格式（见 _STORED_SUFFIXES）直接存储，不再做 DEFLATE。
+        空目录以 "名称/" 目录条目写入。
+
+        Args:
+            zip_path: ZIP 文件输出路径
+            source_dir: 要压缩的目录
+        """
+        with zipfile.ZipFile(
+            zip_path,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            allowZip64=True,
+            compresslevel=self.compresslevel,
+        ) as zf:
+            for root, dirs, files in os.walk(source_dir):
+                # 与 shutil.make_archive 一致保留空目录；非空目录由其成员路径隐含
+                if not dirs and not files and root != source_dir:
+                    zf.write(root, os.path.relpath(root, source_dir))
+                for name in files:
+                    full = os.path.join(root, name)
+                    arcname = os.path.relpath(full, source_dir)
+                    zf.write(
+                        full,
+                        arcname,
+                        compress_type=self._compress_type(arcname),
+                        compresslevel=self.compresslevel,
+                    )
+
+    @staticmethod
+    def _compress_type(arcname: str) -> int:
+        """根据扩展名选择成员的压缩方式
+
+        Args:
+            arcname: 压缩包内的名称
+
+        Returns:
+            已压缩的格式返回 ZIP_STORED，其余返回 ZIP_DEFLATED
+        """
+        suffix = os.path.splitext(arcname)[1].lower()
+        return zipfile.ZIP_STORED if suffix in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
 
 class SmartCleaner:
     """自定义清理器 - 智能清理
@@ -142,6 +201,12 @@ class SmartCleaner:
             keep_patterns: 保留的文件模式列表
         """
         self.keep_patterns = keep_patterns or []
+        # 预编译为单个正则，每个路径只需一次扫描
+        self._keep_re = (
+            re.compile("|".join(re.escape(p) for p in self.keep_patterns))
+            if self.keep_patterns
+            else None
+        )
 
     def clean(self, config: ProjectConfig) -> CleanResult:
         """执行清理（带选择性保留）
@@ -153,23 +218,34 @@ class SmartCleaner:
             清理结果
         """
         try:
-            import shutil
-
-            working_dir = Path(config.working_dir)
+            working_dir = os.fspath(config.working_dir)
+            keep_re = self._keep_re
             files_deleted = 0
 
-            if working_dir.exists():
-                for item in working_dir.rglob("*"):
-                    # 检查是否应该保留
-                    should_keep = any(
-                        pattern in str(item) for pattern in self.keep_patterns
-                    )
-
-                    if not should_keep and item.is_file():
-                        item.unlink()
-                        files_deleted += 1
-                    elif not should_keep and item.is_dir():
-                        shutil.rmtree(item)
+            if os.path.isdir(working_dir):
+                # 自底向上遍历：处理目录时其子项已清理完毕，可直接 rmdir
+                for root, dirs, files, dir_fd in self._walk_bottom_up(working_dir):
+                    for name in files:
+                        full = os.path.join(root, name)
+                        # 检查是否应该保留
+                        if keep_re is None or keep_re.search(full) is None:
+                            # 持有目录 fd 时按名称删除（unlinkat），免去逐级路径解析
+                            os.unlink(full if dir_fd is None else name, dir_fd=dir_fd)
+                            files_deleted += 1
+
+                    for name in dirs:
+                        full = os.path.join(root, name)
+                        if keep_re is not None and keep_re.search(full):
+                            continue
+                        target = full if dir_fd is None else name
+                        try:
+                            os.rmdir(target, dir_fd=dir_fd)
+                        except NotADirectoryError:
+                            # 指向目录的符号链接
+                            os.unlink(target, dir_fd=dir_fd)
+                        except OSError:
+                            # 目录中仍有被保留的内容
+                            continue
                         files_deleted += 1
 
             return CleanResult(
@@ -186,6 +262,25 @@ class SmartCleaner:
                 error=str(e),
             )
 
+    @staticmethod
+    def _walk_bottom_up(top: str):
+        """自底向上遍历目录树
+
+        支持 dir_fd 的平台使用 os.fwalk，产出每个目录已打开的文件描述符；
+        否则回退到 os.walk，描述符为 None。
+
+        Args:
+            top: 要遍历的根目录
+
+        Yields:
+            (目录路径, 子目录名列表, 文件名列表, 目录 fd 或 None)
+        """
+        if _SUPPORTS_DIR_FD:
+            yield from os.fwalk(top, topdown=False)
+        else:
+            for root, dirs, files in os.walk(top, topdown=False):
+                yield root, dirs, files, None
+
 
 def example_1_dependency_injection():
     """示例 1: 依赖注入
@@ -316,6 +411,15 @@ def example_3_advanced_error_handling():
     print()
 
 
+@dataclass(slots=True)
+class _WorkflowStats:
+    """工作流执行统计"""
+
+    success: int = 0
+    failed: int = 0
+    details: list = field(default_factory=list)
+
+
 def example_4_workflow_with_validation():
     """示例 4: 带验证的完整工作流
     
@@ -338,13 +442,9 @@ def example_4_workflow_with_validation():
         ),
     ]
 
-    results = {
-        "success": 0,
-        "failed": 0,
-        "details": [],
-    }
+    stats = _WorkflowStats(details=[None] * len(configs))
 
-    for config in configs:
+    for i, config in enumerate(configs):
         print(f"\n处理: {config.name}")
         print("-" * 40)
 
@@ -369,38 +469,38 @@ def example_4_workflow_with_validation():
                     clean_result = orchestrator.clean()
 
                     status = "✓ 完成" if clean_result.success else "⚠ 部分完成"
-                    results["success"] += 1
+                    stats.success += 1
                 else:
                     status = "✗ 部署失败"
-                    results["failed"] += 1
+                    stats.failed += 1
             else:
                 status = "✗ 构建失败"
-                results["failed"] += 1
+                stats.failed += 1
 
-            results["details"].append((config.name, status))
+            stats.details[i] = (config.name, status)
 
         except Exception as e:
-            results["failed"] += 1
-            results["details"].append((config.name, f"✗ 异常: {e}"))
+            stats.failed += 1
+            stats.details[i] = (config.name, f"✗ 异常: {e}")
 
     # 打印总结
     print("\n" + "=" * 60)
     print("工作流总结")
     print("=" * 60)
-    print(f"成功: {results['success']}")
-    print(f"失败: {results['failed']}")
-    for name, status in results["details"]:
+    print(f"成功: {stats.success}")
+    print(f"失败: {stats.failed}")
+    for name, status in stats.details:
         print(f"  {name}: {status}")
 
     print()
 
 
 # 辅助函数
-def create_orchestrator(config: ProjectConfig) -> Orchestrator:
+def create_orchestrator(
+    config: ProjectConfig, _factory=_create_default_orchestrator
+) -> Orchestrator:
     """创建编排器（从基础示例中复用）"""
-    from evan_tools.setup import create_orchestrator as create_default
-
-    return create_default(config)
+    return _factory(config)
 
 
 if __name__ == "__main__":
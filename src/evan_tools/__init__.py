@@ -1,22 +1,110 @@
-# flake8: noqa: F401, F403, F405
+# flake8: noqa: F401
 
-from .config import *
-from .file import *
-from .importer import *
-from .md5 import *
-from .registry import *
-from .setup import *
-from .time import *
-from .tui import *
-from .zip import *
+from .config import get_config, load_config, sync_config
+from .file import GatherConfig, PathGatherer, SortBy, gather_paths
+from .importer import collect_third_party_imports
+from .md5 import (
+    FileAccessError,
+    FileReadError,
+    HashCalculationError,
+    HashConfig,
+    HashResult,
+    InvalidConfigError,
+    MD5Result,
+    calc_full_md5,
+    calc_sparse_md5,
+    calculate_hash,
+)
+from .registry import (
+    RegistryManager,
+    get_registry,
+    load_commands,
+    register_command,
+    register_with_typer,
+)
+from .setup import (
+    AutoDeployer,
+    BuilderProtocol,
+    BuildError,
+    BuildResult,
+    CleanError,
+    CleanerProtocol,
+    CleanResult,
+    ConfigValidationError,
+    DeployError,
+    DeployerProtocol,
+    DeployResult,
+    FileSystemCleaner,
+    LocalDeployer,
+    Orchestrator,
+    ProjectConfig,
+    PyInstallerBuilder,
+    SetupError,
+    create_orchestrator,
+    run_cli,
+    run_deployer,
+)
+from .time import duration
+from .tui import Tui
+from .zip import ZipType, is_encrypted, unzip_7z, zip_type
 
-__all__ = []
-__all__.extend(config.__all__)
-__all__.extend(file.__all__)
-__all__.extend(md5.__all__)
-__all__.extend(registry.__all__)
-__all__.extend(setup.__all__)
-__all__.extend(time.__all__)
-__all__.extend(tui.__all__)
-__all__.extend(importer.__all__)
-__all__.extend(zip.__all__)
+__all__ = (
+    # config
+    "get_config",
+    "load_config",
+    "sync_config",
+    # file
+    "gather_paths",
+    "PathGatherer",
+    "SortBy",
+    "GatherConfig",
+    # md5
+    "calculate_hash",
+    "HashConfig",
+    "HashResult",
+    "HashCalculationError",
+    "FileAccessError",
+    "FileReadError",
+    "InvalidConfigError",
+    "calc_full_md5",
+    "calc_sparse_md5",
+    "MD5Result",
+    # registry
+    "register_command",
+    "get_registry",
+    "register_with_typer",
+    "load_commands",
+    "RegistryManager",
+    # setup
+    "ProjectConfig",
+    "Orchestrator",
+    "create_orchestrator",
+    "PyInstallerBuilder",
+    "BuilderProtocol",
+    "LocalDeployer",
+    "DeployerProtocol",
+    "FileSystemCleaner",
+    "CleanerProtocol",
+    "BuildResult",
+    "DeployResult",
+    "CleanResult",
+    "SetupError",
+    "BuildError",
+    "DeployError",
+    "CleanError",
+    "ConfigValidationError",
+    "run_cli",
+    "AutoDeployer",
+    "run_deployer",
+    # time
+    "duration",
+    # tui
+    "Tui",
+    # importer
+    "collect_third_party_imports",
+    # zip
+    "zip_type",
+    "ZipType",
+    "is_encrypted",
+    "unzip_7z",
+)
@@ -1,3 +1,3 @@
-from .rw_lock import RWLock
+from .rw_lock import RWLock, ShardedRWLock
 
-__all__ = ["RWLock"]
+__all__ = ["RWLock", "ShardedRWLock"]
@@ -1,32 +1,103 @@
+import itertools
+import os
 import threading
+from typing import Optional
 
 
 class RWLock:
-    """读写锁：允许多个读，一个写（非可重入）。"""
+    """读写锁：允许多个读，一个写（非可重入）。
+
+    写者优先：一旦有写者在等待，新的读者会阻塞到写者完成，
+    持续不断的读请求不会让写者饿死。
+
+    读者与写者在同一把互斥锁上的两个条件变量中等待，释放时只唤醒
+    能够继续执行的一方：最后一个读者离开时只唤醒一个写者，
+    不会把所有等待线程一起唤醒后再让它们重新休眠。
+    """
 
     def __init__(self):
         """初始化读写锁。"""
-        self._read_ready = threading.Condition(threading.Lock())
+        mutex = threading.Lock()
+        self._read_ok = threading.Condition(mutex)
+        self._write_ok = threading.Condition(mutex)
         self._readers = 0
+        self._writers_waiting = 0
+        self._writer_active = False
 
     def acquire_read(self):
         """获取读锁。"""
-        with self._read_ready:
+        with self._read_ok:
+            while self._writer_active or self._writers_waiting:
+                self._read_ok.wait()
             self._readers += 1
 
     def release_read(self):
         """释放读锁。"""
-        with self._read_ready:
+        with self._read_ok:
             self._readers -= 1
-            if self._readers == 0:
-                self._read_ready.notify_all()
+            if self._readers == 0 and self._writers_waiting:
+                self._write_ok.notify()
 
     def acquire_write(self):
         """获取写锁。"""
-        self._read_ready.acquire()
-        while self._readers > 0:
-            self._read_ready.wait()
+        with self._write_ok:
+            self._writers_waiting += 1
+            while self._writer_active or self._readers:
+                self._write_ok.wait()
+            self._writers_waiting -= 1
+            self._writer_active = True
+
+    def release_write(self):
+        """释放写锁。"""
+        with self._write_ok:
+            self._writer_active = False
+            if self._writers_waiting:
+                self._write_ok.notify()
+            else:
+                self._read_ok.notify_all()
+
+
+class ShardedRWLock:
+    """分片读写锁：读者只锁自己的分片，写者按固定顺序锁住全部分片。
+
+    每个线程首次读取时按轮转分配一个分片并缓存在线程局部存储中，
+    不同线程的读者落在不同的 RWLock 上，互不争用同一把内部锁。
+    写者按相同顺序获取所有分片，避免死锁。接口与 RWLock 一致（非可重入）。
+    """
+
+    def __init__(self, n_shards: Optional[int] = None):
+        """初始化分片读写锁。
+
+        参数:
+            n_shards: 分片数量。默认为 CPU 核数。
+        """
+        self._shards = [RWLock() for _ in range(n_shards or os.cpu_count() or 1)]
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+
+    def _shard(self) -> RWLock:
+        """获取当前线程的读分片。"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+            return shard
+
+    def acquire_read(self):
+        """获取读锁（仅锁住当前线程的分片）。"""
+        self._shard().acquire_read()
+
+    def release_read(self):
+        """释放读锁。"""
+        self._shard().release_read()
+
+    def acquire_write(self):
+        """获取写锁（按顺序锁住所有分片）。"""
+        for shard in self._shards:
+            shard.acquire_write()
 
     def release_write(self):
         """释放写锁。"""
-        self._read_ready.release()
+        for shard in reversed(self._shards):
+            shard.release_write()
@@ -10,10 +10,19 @@ class ConfigCache:
     存储最后加载的配置，并根据时间窗口决定是否需要重载。
     有助于避免在频繁访问配置时进行过多的文件系统检查。
 
+    配置与版本号作为一个元组整体发布：写入方替换整个元组，
+    读取方只需一次属性读取即可拿到一致的快照，读路径无需加锁。
+    每次 set() 版本号递增，读取方可以据此缓存由快照派生的数据。
+
+    重载截止时间与快照分开存放：检查后发现文件未变时只需推迟截止时间
+    （defer_reload()），不会与并发的 set() 竞争快照。
+
     属性:
-        _cache: 缓存的配置字典。
-        _last_reload_time: 上次重载的时间戳。
+        _snapshot: (配置字典, 版本号) 元组，尚未加载时为 None。
+        _version: 最近一次发布的版本号。
+        _next_check_ns: 允许下次重载检查的单调时钟截止时间（纳秒）。
         _reload_interval_seconds: 两次重载之间的最小时间。
+        _interval_ns: 以纳秒表示的重载间隔。
     """
 
     def __init__(self, reload_interval_seconds: float = 5.0):
@@ -23,9 +32,11 @@ class ConfigCache:
             reload_interval_seconds: 两次重载检查之间的最小秒数。
                 默认为 5.0 秒。
         """
-        self._cache: Optional[dict[str, Any]] = None
-        self._last_reload_time: float = 0.0
+        self._snapshot: Optional[tuple[dict[str, Any], int]] = None
+        self._version = 0
+        self._next_check_ns = 0
         self._reload_interval_seconds = reload_interval_seconds
+        self._interval_ns = int(reload_interval_seconds * 1_000_000_000)
 
     def get(self) -> Optional[dict[str, Any]]:
         """获取缓存的配置。
@@ -33,7 +44,17 @@ class ConfigCache:
         返回:
             缓存的配置字典，如果尚未加载则返回 None。
         """
-        return self._cache
+        snapshot = self._snapshot
+        return None if snapshot is None else snapshot[0]
+
+    def get_versioned(self) -> tuple[Optional[dict[str, Any]], int]:
+        """原子地获取缓存的配置及其版本号。
+
+        返回:
+            (配置字典, 版本号)。尚未加载时配置为 None、版本号为 0。
+        """
+        snapshot = self._snapshot
+        return (None, 0) if snapshot is None else snapshot
 
     def set(self, config: dict[str, Any]) -> None:
         """使用新配置更新缓存。
@@ -41,8 +62,13 @@ class ConfigCache:
         参数:
             config: 要缓存的配置字典。
         """
-        self._cache = config
-        self._last_reload_time = time.time()
+        self._version += 1
+        self._next_check_ns = time.monotonic_ns() + self._interval_ns
+        self._snapshot = (config, self._version)
+
+    def defer_reload(self) -> None:
+        """检查后未发现变更时调用，推迟下次重载检查一个重载间隔。"""
+        self._next_check_ns = time.monotonic_ns() + self._interval_ns
 
     def should_reload(self) -> bool:
         """检查是否足够的时间已过，可以考虑重载。
@@ -51,13 +77,8 @@ class ConfigCache:
             如果自上次重载以来已过重载间隔，返回 True。
             否则返回 False。
         """
-        if self._cache is None:
-            return True
-
-        elapsed = time.time() - self._last_reload_time
-        return elapsed >= self._reload_interval_seconds
+        return self._snapshot is None or time.monotonic_ns() >= self._next_check_ns
 
     def clear(self) -> None:
         """清除缓存。"""
-        self._cache = None
-        self._last_reload_time = 0.0
+        self._snapshot = None
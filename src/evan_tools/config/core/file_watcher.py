@@ -0,0 +1,186 @@
+"""基于 Linux inotify 的文件变更监听器。"""
+
+import ctypes
+import functools
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h> 中的事件掩码
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+@functools.cache
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """加载提供 inotify 系统调用的 libc，首次使用时才查找。
+
+    返回:
+        libc 句柄，如果当前平台不支持 inotify 则返回 None。
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    # ctypes.util 导入较慢，只在 Linux 上真正需要时导入
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+
+    return libc
+
+
+def inotify_available() -> bool:
+    """检查当前平台是否支持 inotify。"""
+    return _load_libc() is not None
+
+
+class InotifyWatcher:
+    """监听目录中条目的变更，并在命中时调用回调。
+
+    监听的是目录而不是文件本身，因此"写临时文件再 rename"式的保存
+    同样能被捕获。后台守护线程阻塞等待内核推送的事件，调用方无需轮询。
+
+    网络文件系统（NFS/CIFS）上 inotify 可能收不到远端修改，
+    调用方应在需要时保留轮询兜底。
+
+    属性:
+        alive: 监听是否仍然有效。被监听目录被删除或移动后变为 False。
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        on_change: Callable[[], None],
+        names: Optional[frozenset[str]] = None,
+    ):
+        """创建 inotify 实例并启动监听线程。
+
+        参数:
+            directory: 要监听的目录。
+            on_change: 检测到相关变更时调用的回调，在监听线程中执行。
+            names: 只关注这些名称的条目。为 None 时目录中任意条目的变更都会触发。
+
+        抛出:
+            OSError: 如果平台不支持 inotify 或无法添加监听。
+        """
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform")
+
+        self._on_change = on_change
+        self._names = names
+        self.alive = True
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, os.strerror(err), str(directory))
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name=f"config-watcher:{directory}", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """监听线程主循环：等待事件并分发。"""
+        try:
+            while True:
+                readable, _, _ = select.select([self._fd, self._wake_r], [], [])
+                if self._wake_r in readable:
+                    return
+
+                try:
+                    data = os.read(self._fd, _READ_SIZE)
+                except BlockingIOError:
+                    continue
+
+                if self._dispatch(data):
+                    return
+        except OSError as e:
+            logger.warning("Config watcher stopped: %s", e)
+            self.alive = False
+            self._on_change()
+
+    def _dispatch(self, data: bytes) -> bool:
+        """解析一批 inotify 事件，命中时调用一次回调。
+
+        参数:
+            data: 从 inotify fd 读取的原始字节。
+
+        返回:
+            如果监听已失效（目录被删除或移动）返回 True。
+        """
+        changed = False
+        gone = False
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                gone = True
+                changed = True
+            elif self._names is None or os.fsdecode(name) in self._names:
+                changed = True
+
+        if gone:
+            self.alive = False
+        if changed:
+            self._on_change()
+        return gone
+
+    def close(self) -> None:
+        """停止监听线程并释放文件描述符。"""
+        if self._wake_w < 0:
+            return
+
+        os.write(self._wake_w, b"\0")
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
+        self._wake_w = -1
+        self.alive = False
@@ -1,20 +1,44 @@
 """统一的配置管理器，协调所有组件。"""
 
+import functools
 import logging
 from pathlib import Path
-from typing import Any, Optional
-
-import pydash
+from typing import Any, Hashable, Optional
 
 from .cache import ConfigCache
 from .merger import ConfigMerger
+from .query import compile_query, lookup, set_path
 from .reload_controller import ReloadController
 from .source import ConfigSource
-from ..concurrency.rw_lock import RWLock
+from ..concurrency.rw_lock import RWLock, ShardedRWLock
 from ..sources.directory_source import DirectoryConfigSource
 
 logger = logging.getLogger(__name__)
 
+# 查询结果缓存中"尚未计算"与"路径不存在"的标记
+_UNCACHED = object()
+_NOT_FOUND = object()
+
+# 每个快照版本最多缓存的查询数
+_LOOKUP_CACHE_LIMIT = 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_config_path(base_path: Path, config_path: Path) -> Path:
+    """将配置路径规范化为绝对路径，结果按 (基目录, 路径) 缓存。
+
+    resolve() 需要对每一级路径做 realpath 系统调用，而同一配置在每次
+    重载时都会重新解析。缓存在 ConfigManager.initialize_empty() 时清空。
+
+    参数:
+        base_path: 用于解析相对路径的基目录。
+        config_path: 配置文件的路径。
+
+    返回:
+        规范化后的绝对路径。
+    """
+    return (config_path if config_path.is_absolute() else base_path / config_path).resolve()
+
 
 class ConfigManager:
     """线程安全的配置管理器，支持热重载。
@@ -22,15 +46,23 @@ class ConfigManager:
     使用依赖注入协调配置加载、缓存、合并和热重载。
     所有组件都可替换用于测试。
 
+    缓存中的配置以快照形式发布（RCU 风格）：load()/set() 构造新的字典后
+    整体替换，从不原地修改已发布的快照，因此 get() 读取无需加锁；
+    load()/set()/sync() 等写入方通过写锁相互串行化。
+
     属性:
         _source: 用于读写文件的配置源。
         _cache: 具有时间窗口失效的配置缓存。
         _reload_controller: 追踪文件修改以实现热重载。
         _merger: 合并多个配置字典。
-        _lock: 读写锁用于线程安全访问。
+        _lock: 读写锁，串行化配置的写入与同步。读取路径不使用它。
         _config_path: 主配置文件的路径。
         _base_path: 用于解析相对路径的基目录。
         _default_config: 与加载的配置合并的默认配置。
+        _lookups: (快照版本, 查询结果缓存)。快照不可变，
+            同一版本内相同查询的结果可以直接复用。
+        _get_versioned: 绑定的 _cache.get_versioned。
+        _defer_reload: 绑定的 _cache.defer_reload。
     """
 
     def __init__(
@@ -39,7 +71,7 @@ class ConfigManager:
         cache: Optional[ConfigCache] = None,
         reload_controller: Optional[ReloadController] = None,
         merger: Optional[ConfigMerger] = None,
-        lock: Optional[RWLock] = None,
+        lock: Optional[RWLock | ShardedRWLock] = None,
         reload_interval_seconds: float = 5.0,
     ):
         """初始化配置管理器。
@@ -49,7 +81,8 @@ class ConfigManager:
             cache: 配置缓存。默认为新的 ConfigCache。
             reload_controller: 重载控制器。默认为新的 ReloadController。
             merger: 配置合并器。默认为 ConfigMerger。
-            lock: 读写锁。默认为新的 RWLock。
+            lock: 读写锁。默认为新的 RWLock；读者众多时可传入
+                ShardedRWLock，读者之间互不争用。
             reload_interval_seconds: 重载检查的最小间隔秒数。
         """
         self._source = source or DirectoryConfigSource()
@@ -61,6 +94,11 @@ class ConfigManager:
         self._config_path: Optional[Path] = None
         self._base_path: Optional[Path] = None
         self._default_config: dict[str, Any] = {}
+        self._lookups: tuple[int, dict[Any, Any]] = (0, {})
+
+        # 读取路径上用到的缓存方法在构造时绑定，每次 get() 不再逐层查找属性
+        self._get_versioned = self._cache.get_versioned
+        self._defer_reload = self._cache.defer_reload
 
     def initialize_empty(self) -> None:
         """初始化空配置，不绑定文件路径。"""
@@ -71,6 +109,19 @@ class ConfigManager:
             self._base_path = None
             self._default_config = {}
             self._reload_controller.reset()
+            _resolve_config_path.cache_clear()
+        finally:
+            self._lock.release_write()
+
+    def close(self) -> None:
+        """释放热重载使用的资源（inotify 监听线程与文件描述符）。
+
+        已加载的配置仍可读取，之后的变更检测回退到 mtime 轮询。
+        不再使用管理器时应调用，可以重复调用。
+        """
+        self._lock.acquire_write()
+        try:
+            self._reload_controller.close()
         finally:
             self._lock.release_write()
 
@@ -111,43 +162,66 @@ class ConfigManager:
 
         self._lock.acquire_write()
         try:
-            loaded_config = self._source.read(config_path, base_path)
+            return self._load_unlocked(config_path, base_path, default_config)
+        finally:
+            self._lock.release_write()
 
-            if default_config:
-                final_config = self._merger.merge(default_config, loaded_config)
-            else:
-                final_config = loaded_config
+    def _load_unlocked(
+        self,
+        config_path: Path,
+        base_path: Path,
+        default_config: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """加载配置并发布快照。调用方必须持有写锁。
 
-            self._cache.set(final_config)
+        参数:
+            config_path: 配置文件的路径。
+            base_path: 用于解析相对路径的基目录。
+            default_config: 与加载的配置合并的默认配置。
 
-            resolved_path = (
-                config_path if config_path.is_absolute() else base_path / config_path
-            )
-            self._reload_controller.set_config_path(resolved_path.resolve())
+        返回:
+            加载并合并的配置字典。
+        """
+        loaded_config = self._source.read(config_path, base_path)
 
-            self._config_path = config_path
-            self._base_path = base_path
-            self._default_config = default_config or {}
+        if default_config:
+            final_config = self._merger.merge(default_config, loaded_config)
+        else:
+            final_config = loaded_config
 
-            logger.info(f"Configuration loaded: {config_path}")
-            return final_config
+        self._cache.set(final_config)
 
-        finally:
-            self._lock.release_write()
+        self._reload_controller.set_config_path(
+            _resolve_config_path(base_path, config_path)
+        )
 
-    def get(self, query: Optional[str] = None, default: Any = None) -> Any:
+        self._config_path = config_path
+        self._base_path = base_path
+        self._default_config = default_config or {}
+
+        logger.info("Configuration loaded: %s", config_path)
+        return final_config
+
+    def get(
+        self,
+        query: Optional[str | tuple[Hashable, ...] | list[Hashable]] = None,
+        default: Any = None,
+    ) -> Any:
         """获取配置值，支持热重载。
 
         如果文件已更改且重载间隔已过，则自动重载配置。
-        使用 pydash 进行嵌套查询。
+        点号路径在首次查询时编译为键元组并缓存，之后直接逐级查找。
 
         参数:
-            query: 配置值的点号标记路径（例如 "db.host"）。
+            query: 配置值的点号标记路径（例如 "db.host"），
+                或已拆分好的键序列（例如 ("db", "host") 或 ["db", "host"]）。
                 如果为 None，返回整个配置。
             default: 如果查询不匹配任何内容时的默认值。
 
         返回:
             配置值，或如果未找到则返回默认值。
+            返回的字典和列表是已发布快照的一部分，在读取方之间共享，
+            调用方不应原地修改；需要修改时请先复制，或使用 set()。
 
         示例:
             >>> manager.load("config.yaml")
@@ -158,24 +232,36 @@ class ConfigManager:
         """
         self._reload_if_needed()
 
-        self._lock.acquire_read()
-        try:
-            config = self._cache.get()
-            if config is None:
-                return default
+        # 缓存中的配置是只发布不修改的快照，读取无需加锁
+        config, version = self._get_versioned()
+        if config is None:
+            return default
 
-            if query is None:
-                return config
+        if query is None:
+            return config
 
-            return pydash.get(config, query, default)
+        if isinstance(query, list):
+            query = tuple(query)
 
-        finally:
-            self._lock.release_read()
+        lookups_version, lookups = self._lookups
+        if lookups_version != version:
+            lookups = {}
+            self._lookups = (version, lookups)
+
+        value = lookups.get(query, _UNCACHED)
+        if value is _UNCACHED:
+            keys = query if isinstance(query, tuple) else compile_query(query)
+            value = lookup(config, keys, _NOT_FOUND)
+            if len(lookups) < _LOOKUP_CACHE_LIMIT:
+                lookups[query] = value
+
+        return default if value is _NOT_FOUND else value
 
     def set(self, query: str, value: Any) -> None:
         """设置配置值，可选择同步到文件。
 
-        使用 pydash.set_ 更新内存中的配置。
+        只复制从根到目标键路径上的字典，其余子树与当前配置共享，
+        再整体发布为新快照，已交给读者的旧快照不受影响。
         不会自动写入文件 - 调用 sync() 来持久化。
 
         参数:
@@ -188,11 +274,10 @@ class ConfigManager:
         """
         self._lock.acquire_write()
         try:
-            config = self._cache.get()
-            if config is None:
-                config = {}
-
-            pydash.set_(config, query, value)
+            current = self._cache.get()
+            config = set_path(
+                current if current is not None else {}, compile_query(query), value
+            )
             self._cache.set(config)
 
         finally:
@@ -210,7 +295,9 @@ class ConfigManager:
         if self._config_path is None:
             raise RuntimeError("No configuration loaded. Call load() before sync().")
 
-        self._lock.acquire_read()
+        # 读取方从不加锁，锁只用于串行化写入方；写文件同样是写入操作，
+        # 持有写锁可避免并发 sync 交错写同一文件，或与 load() 交错
+        self._lock.acquire_write()
         try:
             config = self._cache.get()
             if config is None:
@@ -218,10 +305,10 @@ class ConfigManager:
 
             self._source.write(self._config_path, config, self._base_path)
 
-            logger.info(f"Configuration synced to {self._config_path}")
+            logger.info("Configuration synced to %s", self._config_path)
 
         finally:
-            self._lock.release_read()
+            self._lock.release_write()
 
     def reload(self) -> dict[str, Any]:
         """强制立即从文件重载配置。
@@ -243,13 +330,31 @@ class ConfigManager:
     def _reload_if_needed(self) -> None:
         """检查是否需要重载并在必要时执行。
 
-        重载发生在以下情况：
-        1. 缓存表示重载间隔已过
-        2. ReloadController 检测到文件修改
+        由 inotify 事件驱动时，监听线程报告变更后立即进入检查，
+        无需时间窗口节流。无论是否启用 inotify，缓存表示重载间隔已过后
+        都会由 ReloadController 比较一次 mtime 作为兜底，未变时推迟下次检查：
+        NFS/CIFS 与绑定挂载上的修改可能永远不会产生 inotify 事件。
+
+        变更检查本身不加锁，只有确实需要重载时才获取写锁。并发读者中
+        通常只有一个会看到同一次变更；偶尔重复也只是多重载一次。
         """
-        if not self._cache.should_reload():
+        controller = self._reload_controller
+        if not controller.has_pending_change and not self._cache.should_reload():
+            return
+
+        if self._config_path is None or not controller.has_file_changed():
+            self._defer_reload()
             return
 
-        if self._reload_controller.has_file_changed():
+        self._lock.acquire_write()
+        try:
+            # 等待写锁期间配置可能已被解除绑定
+            if self._config_path is None:
+                return
+
             logger.info("Configuration file changed, reloading...")
-            self.reload()
+            self._load_unlocked(
+                self._config_path, self._base_path, self._default_config
+            )
+        finally:
+            self._lock.release_write()
@@ -2,14 +2,39 @@
 
 from typing import Any
 
-import pydash
+from .query import copy_tree
+
+
+def _deep_merge(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+    """将 src 递归合并进 dst（原地修改 dst）。
+
+    仅当两侧都是字典时递归合并，其他值（包括列表）整体覆盖。
+    来自 src 的字典和列表会被复制，合并结果不与输入共享可变对象。
+
+    参数:
+        dst: 合并目标，仅包含本模块创建的字典。
+        src: 要合并的配置。
+
+    返回:
+        合并后的 dst。
+    """
+    for key, value in src.items():
+        if isinstance(value, dict):
+            current = dst.get(key)
+            if not isinstance(current, dict):
+                current = dst[key] = {}
+            _deep_merge(current, value)
+        elif isinstance(value, list):
+            dst[key] = copy_tree(value)
+        else:
+            dst[key] = value
+    return dst
 
 
 class ConfigMerger:
     """使用深合并策略合并多个配置字典。
 
-    使用 pydash 的 merge_with 进行深合并，确保嵌套
-    字典被正确组合而不是被替换。
+    嵌套字典被递归组合而不是被替换；列表和标量值由后面的配置整体覆盖。
     """
 
     @staticmethod
@@ -31,11 +56,8 @@ class ConfigMerger:
             >>> ConfigMerger.merge(base, override)
             {'db': {'host': 'prod.example.com', 'port': 5432}}
         """
-        if not configs:
-            return {}
-
         result: dict[str, Any] = {}
         for config in configs:
-            result = pydash.merge_with(result, config)
+            _deep_merge(result, config)
 
         return result
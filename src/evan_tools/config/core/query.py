@@ -0,0 +1,230 @@
+"""点号路径查询：一次编译、多次求值。"""
+
+import functools
+import re
+import sys
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+# 与 pydash 相同的路径语法：未转义的点号分隔，"[n]" 为列表下标
+_PATH_KEY_DELIM = re.compile(r"(?<!\\)(?:\\\\)*\.|(\[-?\d+\])")
+_PATH_LIST_INDEX = re.compile(r"^\[-?\d+\]$")
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_query(query: str) -> tuple[Hashable, ...]:
+    """将点号路径解析为键元组。
+
+    解析结果按查询字符串缓存，重复查询不再重新解析。
+    路径语法与 pydash.to_path 一致，支持 "a.b"、"a[0].b" 和转义的点号 "a\\.b"。
+    字符串键会被驻留（sys.intern），与加载时驻留的配置键为同一对象，
+    字典查找可直接按指针命中。
+
+    参数:
+        query: 点号标记路径（例如 "db.host"）。
+
+    返回:
+        逐级查找所用的键元组。
+    """
+    return tuple(
+        sys.intern(key) if isinstance(key, str) else key
+        for key in _split_path(query)
+    )
+
+
+def _split_path(query: str) -> list[Hashable]:
+    """按 pydash.to_path 的规则拆分路径字符串。
+
+    常见的纯点号路径直接 str.split，只有包含转义或方括号下标时才走正则。
+
+    参数:
+        query: 点号标记路径。
+
+    返回:
+        键列表，方括号下标转换为整数。
+    """
+    if "." not in query and "[" not in query:
+        return [query]
+    if "\\" not in query and "[" not in query:
+        return query.split(".")
+
+    parts = _PATH_KEY_DELIM.split(query)
+    keys: list[Hashable] = []
+    for idx, part in enumerate(parts):
+        if part is None:
+            continue
+
+        if part == "":
+            # 方括号下标旁因 split 产生的空串不是键；"a..b" 中的空键保留
+            prev_part = parts[idx - 1] if idx else None
+            next_part = parts[idx + 1] if idx + 1 < len(parts) else None
+            if prev_part is not None and next_part is not None:
+                continue
+            if _list_index(prev_part) is not None or _list_index(next_part) is not None:
+                continue
+
+        index = _list_index(part)
+        if index is not None:
+            keys.append(index)
+        else:
+            keys.append(part.replace("\\\\", "\\").replace("\\.", "."))
+
+    return keys
+
+
+def _list_index(part: Optional[str]) -> Optional[int]:
+    """如果 part 形如 "[n]"，返回下标 n，否则返回 None。"""
+    if part is not None and _PATH_LIST_INDEX.match(part):
+        return int(part[1:-1])
+    return None
+
+
+def lookup(obj: Any, keys: tuple[Hashable, ...], default: Any = None) -> Any:
+    """按已编译的键元组在嵌套配置中查找值。
+
+    行为与 pydash.get 在字典、列表上的语义一致：
+    字典中找不到 "0" 时会再尝试整数键 0（反之亦然），
+    序列按整数下标（支持负数）访问。
+
+    参数:
+        obj: 嵌套的配置对象。
+        keys: compile_query 返回的键元组。
+        default: 路径不存在时返回的默认值。
+
+    返回:
+        找到的值，或默认值。
+    """
+    for key in keys:
+        if isinstance(obj, dict):
+            value = obj.get(key, _MISSING)
+            if value is _MISSING:
+                alternate = _alternate_key(key)
+                if alternate is _MISSING:
+                    return default
+                value = obj.get(alternate, _MISSING)
+                if value is _MISSING:
+                    return default
+            obj = value
+        elif isinstance(obj, (list, tuple, str)):
+            try:
+                obj = obj[int(key)]
+            except (TypeError, ValueError, IndexError):
+                return default
+        else:
+            return default
+
+    return obj
+
+
+def _alternate_key(key: Hashable) -> Any:
+    """返回字符串键与整数键之间的互换形式，无对应形式时返回 _MISSING。"""
+    if isinstance(key, str):
+        try:
+            return int(key)
+        except ValueError:
+            return _MISSING
+    if isinstance(key, int):
+        return str(key)
+    return _MISSING
+
+
+def set_path(root: dict[str, Any], keys: tuple[Hashable, ...], value: Any) -> dict[str, Any]:
+    """以路径复制的方式写入值，返回新的根字典。
+
+    只复制从根到目标位置路径上的容器，其余子树与原配置共享，
+    原配置保持不变。缺失或非容器的中间节点会被替换为新容器：
+    下一级键为整数（如 "a[0]"）时创建列表，否则创建字典。
+    向列表写入超出长度的下标时以 None 补齐。
+
+    参数:
+        root: 原配置根字典，不会被修改。
+        keys: compile_query 返回的键元组。
+        value: 要写入的值。
+
+    返回:
+        写入后的新根字典。
+    """
+    new_root = dict(root)
+    parent: Any = new_root
+    last = len(keys) - 1
+
+    for i, key in enumerate(keys):
+        if i == last:
+            _assign(parent, key, value)
+            break
+
+        child = _child(parent, key)
+        if isinstance(child, dict):
+            child = dict(child)
+        elif isinstance(child, list):
+            child = list(child)
+        else:
+            child = [] if isinstance(keys[i + 1], int) else {}
+
+        _assign(parent, key, child)
+        parent = child
+
+    return new_root
+
+
+def _child(container: dict | list, key: Hashable) -> Any:
+    """读取容器中的子节点，不存在时返回 None。"""
+    if isinstance(container, list):
+        index = int(key)
+        return container[index] if -len(container) <= index < len(container) else None
+    return container.get(key)
+
+
+def _assign(container: dict | list, key: Hashable, value: Any) -> None:
+    """向容器写入子节点，列表下标越界时以 None 补齐。"""
+    if isinstance(container, list):
+        index = int(key)
+        if index >= len(container):
+            container.extend([None] * (index - len(container) + 1))
+        container[index] = value
+    else:
+        container[key] = value
+
+
+def intern_keys(obj: Any) -> Any:
+    """递归驻留配置中所有字典的字符串键。
+
+    在加载时调用一次，使配置键与 compile_query 产生的键为同一对象。
+
+    参数:
+        obj: 解析得到的配置对象。
+
+    返回:
+        键已驻留的新配置对象（字典和列表会被重建）。
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): intern_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [intern_keys(item) for item in obj]
+    return obj
+
+
+def copy_tree(obj: Any) -> Any:
+    """复制由字典、列表和标量组成的配置树。
+
+    只处理 YAML 安全加载可能产生的类型：字典和列表被逐层重建，
+    其余值（字符串、数字、布尔值、None、日期等不可变对象）直接共享。
+    配置树不会有循环引用，因此无需 copy.deepcopy 的 memo 和类型分派，
+    速度快数倍。
+
+    参数:
+        obj: 要复制的配置对象。
+
+    返回:
+        与输入不共享任何字典或列表的副本。
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {key: copy_tree(value) for key, value in obj.items()}
+    if cls is list:
+        return [copy_tree(item) for item in obj]
+    return obj
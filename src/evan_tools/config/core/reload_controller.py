@@ -1,25 +1,78 @@
-"""配置重载控制器，追踪文件修改时间以实现热重载。"""
+"""配置重载控制器，追踪文件修改以实现热重载。"""
 
+import logging
 import os
+import stat
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+from .file_watcher import InotifyWatcher, inotify_available
+
+logger = logging.getLogger(__name__)
+
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+# 文件为其 mtime（纳秒）；目录为其中 YAML 文件 (名称, mtime, 大小) 的有序元组
+_Signature = int | tuple[tuple[str, int, int], ...]
+
 
 class ReloadController:
     """根据文件更改控制何时应重载配置。
 
-    追踪配置文件的修改时间，并通过比较当前 mtime
-    与缓存的 mtime 来确定是否需要重载。
+    在支持 inotify 的平台上，由内核推送的文件事件驱动变更检测，
+    有事件时 has_file_changed() 只需读取一个标志位；没有事件时，
+    以及不支持 inotify 的平台上，追踪配置文件的修改时间，
+    通过比较当前 mtime 与缓存的 mtime 来确定是否需要重载。
+    配置路径为目录时，一次 os.scandir 遍历比较其中所有 YAML 文件的元数据。
 
     属性:
         _config_path: 正在跟踪的配置文件路径。
-        _last_mtime: 配置文件的最后已知修改时间。
+        _last_signature: 配置路径最后已知的元数据签名。
+        _use_inotify: 是否尝试使用 inotify 监听。
+        _watcher: 当前的 inotify 监听器，未启用时为 None。
+        _changed: 监听线程检测到变更时置位的事件。
+        _last_event_ns: 最近一次变更事件的单调时钟时间（纳秒）。
+        _debounce_ns: 事件静默多久后才报告变更（纳秒）。
     """
 
-    def __init__(self):
-        """初始化重载控制器。"""
+    def __init__(self, use_inotify: bool = True, debounce_seconds: float = 0.1):
+        """初始化重载控制器。
+
+        参数:
+            use_inotify: 是否在可用时使用 inotify 监听文件变更。
+                为 False 时始终使用 mtime 轮询。
+            debounce_seconds: 事件去抖窗口。编辑器保存（写临时文件 + rename）
+                等操作会连续产生多个事件，只有在最后一个事件之后静默
+                这么久才报告变更，一次突发只触发一次重载。默认为 0.1 秒。
+        """
         self._config_path: Optional[Path] = None
-        self._last_mtime: Optional[float] = None
+        self._last_signature: Optional[_Signature] = None
+        # 平台是否支持 inotify 推迟到首次设置路径时再检查
+        self._use_inotify = use_inotify
+        self._watcher: Optional[InotifyWatcher] = None
+        self._changed = threading.Event()
+        self._last_event_ns = 0
+        self._debounce_ns = int(debounce_seconds * 1_000_000_000)
+
+    @property
+    def is_event_driven(self) -> bool:
+        """当前是否由 inotify 事件驱动变更检测。"""
+        return self._watcher is not None and self._watcher.alive
+
+    @property
+    def has_pending_change(self) -> bool:
+        """是否有已度过去抖窗口、尚未处理的变更（不清除标志）。"""
+        return (
+            self._changed.is_set()
+            and time.monotonic_ns() - self._last_event_ns >= self._debounce_ns
+        )
+
+    def _on_event(self) -> None:
+        """监听线程回调：记录事件时间并置位变更标志。"""
+        self._last_event_ns = time.monotonic_ns()
+        self._changed.set()
 
     def set_config_path(self, config_path: Path) -> None:
         """设置要跟踪的配置文件路径。
@@ -27,15 +80,68 @@ class ReloadController:
         参数:
             config_path: 配置文件的路径。
         """
-        self._config_path = config_path
-        self._update_mtime()
-
-    def _update_mtime(self) -> None:
-        """从文件系统更新缓存的修改时间。"""
-        if self._config_path and self._config_path.exists():
-            self._last_mtime = os.path.getmtime(self._config_path)
-        else:
-            self._last_mtime = None
+        if config_path != self._config_path or not self.is_event_driven:
+            self._stop_watcher()
+            self._config_path = config_path
+            if self._use_inotify and inotify_available():
+                self._start_watcher()
+
+        self._update_signature()
+
+    def _start_watcher(self) -> None:
+        """为当前配置路径启动 inotify 监听，失败时回退到 mtime 轮询。"""
+        path = self._config_path
+        try:
+            if path.is_dir():
+                watcher = InotifyWatcher(path, self._on_event)
+            else:
+                watcher = InotifyWatcher(
+                    path.parent, self._on_event, names=frozenset({path.name})
+                )
+        except OSError as e:
+            logger.debug("inotify unavailable for %s, falling back to mtime polling: %s", path, e)
+            return
+
+        self._changed.clear()
+        self._watcher = watcher
+
+    def _stop_watcher(self) -> None:
+        """停止当前的 inotify 监听。"""
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+        self._changed.clear()
+
+    def _stat_signature(self) -> Optional[_Signature]:
+        """获取配置路径的元数据签名，路径不存在时返回 None。
+
+        文件只需一次 stat，取纳秒精度的 mtime，避免粗粒度 mtime（FAT/NFS）
+        下同一秒内的修改被漏检。原地修改文件不会改变所在目录的 mtime，
+        因此目录需要用一次 os.scandir 遍历收集其中 YAML 文件的元数据，
+        新增、删除和修改都会反映在签名中。
+        """
+        try:
+            st = os.stat(self._config_path)
+            if not stat.S_ISDIR(st.st_mode):
+                return st.st_mtime_ns
+
+            with os.scandir(self._config_path) as entries:
+                files = [
+                    entry
+                    for entry in entries
+                    if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file()
+                ]
+            return tuple(sorted(
+                (entry.name, entry_stat.st_mtime_ns, entry_stat.st_size)
+                for entry in files
+                for entry_stat in (entry.stat(),)
+            ))
+        except FileNotFoundError:
+            return None
+
+    def _update_signature(self) -> None:
+        """从文件系统更新缓存的元数据签名。"""
+        self._last_signature = self._stat_signature() if self._config_path else None
 
     def has_file_changed(self) -> bool:
         """检查配置文件是否自上次检查以来被修改。
@@ -47,24 +153,39 @@ class ReloadController:
         if not self._config_path:
             return True
 
-        if not self._config_path.exists():
-            if self._last_mtime is not None:
-                self._last_mtime = None
+        if self._watcher is not None and self._changed.is_set():
+            # 事件尚在去抖窗口内时不轮询，等这一轮突发结束后只报告一次
+            if not self.has_pending_change:
+                return False
+            self._changed.clear()
+            self._update_signature()
+            return True
+
+        # 没有事件时即使监听线程仍然存活也比较签名：NFS/CIFS 与绑定挂载上
+        # 远端或其他挂载点的修改可能永远不会产生 inotify 事件
+        current = self._stat_signature()
+        if current is None:
+            if self._last_signature is not None:
+                self._last_signature = None
                 return True
             return False
 
-        current_mtime = os.path.getmtime(self._config_path)
-        if self._last_mtime is None:
-            self._last_mtime = current_mtime
-            return True
-
-        if current_mtime != self._last_mtime:
-            self._last_mtime = current_mtime
+        if current != self._last_signature:
+            self._last_signature = current
             return True
 
         return False
 
+    def close(self) -> None:
+        """停止 inotify 监听，释放监听线程、inotify fd 与唤醒管道。
+
+        关闭后变更检测回退到 mtime 轮询；再次调用 set_config_path()
+        会重新启动监听。可以重复调用。
+        """
+        self._stop_watcher()
+
     def reset(self) -> None:
-        """重置控制器状态。"""
+        """重置控制器状态，并停止 inotify 监听。"""
+        self._stop_watcher()
         self._config_path = None
-        self._last_mtime = None
+        self._last_signature = None
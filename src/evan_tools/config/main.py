@@ -6,6 +6,7 @@
 """
 
 import logging
+import os
 import typing as t
 from pathlib import Path
 
@@ -15,28 +16,45 @@ logger = logging.getLogger(__name__)
 
 T = t.TypeVar("T")
 
-_manager: ConfigManager | None = None
+_YAML_SUFFIXES = (".yaml", ".yml")
 
+# 全局 ConfigManager 单例。构造很轻（不读取文件、不启动线程），
+# 在导入时创建，热路径上无需每次检查是否已初始化。
+_manager = ConfigManager()
 
-def _get_manager() -> ConfigManager:
-    """获取或创建全局 ConfigManager 实例。
+
+def _resolve_config_path(path: str) -> str | None:
+    """确定 load_config 实际要加载的路径。
+
+    目录直接使用；没有后缀的路径优先匹配同名的 .yaml/.yml 文件；
+    其余情况使用路径本身。
+
+    参数:
+        path: 用户传入的路径字符串。
 
     返回:
-        全局 ConfigManager 单例。
+        要加载的绝对路径，如果不存在则返回 None。
     """
-    global _manager
-    if _manager is None:
-        _manager = ConfigManager()
-    return _manager
+    if os.path.isdir(path):
+        return os.path.abspath(path)
+
+    if not os.path.splitext(path)[1]:
+        for suffix in _YAML_SUFFIXES:
+            candidate = path + suffix
+            if os.path.isfile(candidate):
+                return os.path.abspath(candidate)
+
+    return os.path.abspath(path) if os.path.exists(path) else None
 
 
 def load_config(path: Path | None = None) -> None:
     """从磁盘加载配置。
 
     参数:
-        path: 配置文件或目录的路径。如果为 None，默认为 "config"。
+        path: 配置文件或目录的路径。如果为 None，默认为 "configs"。
             如果提供目录，则扫描并合并其中所有 YAML 文件。
             如果提供文件，则仅加载该文件。
+            没有后缀时自动查找同名的 .yaml/.yml 文件。
 
     说明:
         如果配置文件/目录不存在，将初始化为空配置并返回。
@@ -44,52 +62,21 @@ def load_config(path: Path | None = None) -> None:
     抛出:
         ValueError: 如果文件格式不受支持。
     """
-    if path is None:
-        path = Path("configs")
-    else:
-        path = Path(path)
+    raw_path = os.fspath(path) if path is not None else "configs"
+    resolved = _resolve_config_path(raw_path)
 
-    if not path.exists():
-        print(f"Configuration path does not exist: {path}")
-        _get_manager().initialize_empty()
+    if resolved is None:
+        print(f"Configuration path does not exist: {raw_path}")
+        _manager.initialize_empty()
         return
 
-    if path.is_dir():
-        logger.info(f"Loading configuration from directory: {path}")
-        try:
-            _get_manager().load(path)
-            logger.info("Configuration loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
-            return
-        return
-
-    if not path.suffix:
-        if (path.parent / f"{path.name}.yaml").exists():
-            path = path.parent / f"{path.name}.yaml"
-        elif (path.parent / f"{path.name}.yml").exists():
-            path = path.parent / f"{path.name}.yml"
-        else:
-            if path.name == "configs":
-                path = path.parent / "configs"
-                if path.is_dir():
-                    logger.info(f"Loading configuration from directory: {path}")
-                    try:
-                        _get_manager().load(path)
-                        logger.info("Configuration loaded successfully")
-                    except Exception as e:
-                        logger.error(f"Failed to load configuration: {e}")
-                        return
-                    return
-            path = path.with_suffix(".yaml")
-
-    logger.info(f"Loading configuration from: {path}")
+    logger.info("Loading configuration from: %s", resolved)
 
     try:
-        _get_manager().load(path)
+        _manager.load(Path(resolved))
         logger.info("Configuration loaded successfully")
     except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
+        logger.error("Failed to load configuration: %s", e)
         return
 
 
@@ -118,6 +105,7 @@ def get_config(path: PathT | None = None, default: t.Any = None) -> t.Any:
 
     返回:
         配置值，如果未找到则返回默认值。
+        返回的字典和列表与其他调用方共享（不做深拷贝），请勿原地修改。
 
     示例:
         >>> load_config("configs")
@@ -126,17 +114,15 @@ def get_config(path: PathT | None = None, default: t.Any = None) -> t.Any:
         >>> get_config(["database", "port"], 5432)
         5432
     """
-    manager = _get_manager()
-
     if isinstance(path, list):
-        query = ".".join(str(p) for p in path)
+        query = tuple(str(p) for p in path)
     elif path is None:
         query = None
     else:
         query = str(path)
 
-    result = manager.get(query, default)
-    logger.debug(f"Retrieved config: {query}")
+    result = _manager.get(query, default)
+    logger.debug("Retrieved config: %s", query)
     return result
 
 
@@ -151,10 +137,10 @@ def sync_config() -> None:
     logger.info("Syncing configuration to file")
 
     try:
-        _get_manager().sync()
+        _manager.sync()
         logger.info("Configuration synced successfully")
     except Exception as e:
-        logger.error(f"Failed to sync configuration: {e}")
+        logger.error("Failed to sync configuration: %s", e)
         raise
 
 
@@ -1,13 +1,18 @@
 """基于目录的配置源，支持多文件扫描。"""
 
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Any, Optional
 
+from ..core.merger import ConfigMerger
 from .yaml_source import YamlConfigSource
 
 logger = logging.getLogger(__name__)
 
+_YAML_SUFFIXES = (".yaml", ".yml")
+
 
 class DirectoryConfigSource(YamlConfigSource):
     """扫描并合并来自目录的多个 YAML 文件的配置源。
@@ -35,10 +40,14 @@ class DirectoryConfigSource(YamlConfigSource):
         """
         resolved_path = self._resolve_path(path, base_path)
 
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Configuration path not found: {resolved_path}")
+        try:
+            st = os.stat(resolved_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration path not found: {resolved_path}"
+            ) from None
 
-        if resolved_path.is_file():
+        if not stat.S_ISDIR(st.st_mode):
             return super().read(path, base_path)
 
         return self._read_directory(resolved_path)
@@ -52,29 +61,60 @@ class DirectoryConfigSource(YamlConfigSource):
         返回:
             来自所有 YAML 文件的合并配置。
         """
-        yaml_files = sorted(
-            list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
-        )
+        yaml_files = self._scan_yaml_files(directory)
 
         if not yaml_files:
             logger.warning(f"No YAML files found in {directory}")
             return {}
 
-        merged_config: dict[str, Any] = {}
+        # 逐个串行解析：libyaml 的构造/组合阶段持有 GIL，线程池并行反而更慢
+        results = [self._read_file_config(yaml_file) for yaml_file in yaml_files]
+        file_configs = [config for config in results if config is not None]
 
-        for yaml_file in yaml_files:
-            try:
-                file_config = super().read(yaml_file)
-                from ..core.merger import ConfigMerger
-                merged_config = ConfigMerger.merge(merged_config, file_config)
-                logger.debug(f"Loaded and merged {yaml_file.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {yaml_file}: {e}")
-                continue
+        # 一次性合并所有文件，避免逐对合并反复复制不断增长的中间结果
+        merged_config = ConfigMerger.merge(*file_configs)
 
         logger.info(f"Loaded and merged {len(yaml_files)} YAML files from {directory}")
         return merged_config
 
+    def _read_file_config(self, yaml_file: Path) -> Optional[dict[str, Any]]:
+        """读取目录中的单个 YAML 文件，失败时记录错误并跳过。
+
+        参数:
+            yaml_file: YAML 文件路径。
+
+        返回:
+            文件的配置字典，读取失败时返回 None。
+        """
+        try:
+            config = super().read(yaml_file)
+        except Exception as e:
+            logger.error(f"Failed to load {yaml_file}: {e}")
+            return None
+
+        logger.debug(f"Loaded {yaml_file.name}")
+        return config
+
+    @staticmethod
+    def _scan_yaml_files(directory: Path) -> list[Path]:
+        """列出目录中的 YAML 文件（不递归），按文件名排序。
+
+        单次 os.scandir 遍历，文件类型取自目录项缓存，无需逐个 stat。
+
+        参数:
+            directory: 目录路径。
+
+        返回:
+            排序后的 YAML 文件路径列表。
+        """
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(_YAML_SUFFIXES) and entry.is_file()
+            )
+        return [directory / name for name in names]
+
     def supports(self, path: Path) -> bool:
         """检查此源是否支持给定路径。
 
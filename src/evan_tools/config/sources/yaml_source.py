@@ -1,23 +1,133 @@
 """YAML 配置源实现。"""
 
+import functools
+import hashlib
 import logging
+import mmap
+import os
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
+from ..core.query import copy_tree, intern_keys
 from ..core.source import ConfigSource
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _yaml() -> tuple[Any, type, type]:
+    """首次读写时才导入 PyYAML，导入 evan_tools 本身不承担这部分开销。
+
+    返回:
+        (yaml 模块, 安全加载器, 安全生成器)。libyaml 可用时使用其 C 实现，
+        比纯 Python 解析器/生成器快一个数量级。
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as dumper
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeDumper as dumper
+        from yaml import SafeLoader as loader
+
+    return yaml, loader, dumper
+
+
+# 超过此大小的文件通过 mmap 读取，摘要和解析直接使用页缓存，不复制整个文件
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_file(path: Path, size_hint: int) -> bytes:
+    """以尽量少的系统调用读取整个文件。
+
+    按 stat 得到的大小多请求一个字节，文件未变化时一次 os.read 即可读到 EOF，
+    不经过 Python 缓冲 IO 层的额外 fstat 和分块读取。
+
+    参数:
+        path: 文件路径。
+        size_hint: 预期的文件大小。
+
+    返回:
+        文件内容。
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        want = size_hint + 1
+        while True:
+            chunk = os.read(fd, want)
+            chunks.append(chunk)
+            if len(chunk) < want:
+                # 普通文件的短读意味着已到 EOF
+                break
+            want = 64 * 1024
+    finally:
+        os.close(fd)
+
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _has_content(path: Path, payload: bytes) -> bool:
+    """检查文件内容是否与 payload 完全相同。
+
+    大小不同时只需一次 stat，无需读取文件。
+
+    参数:
+        path: 文件路径。
+        payload: 要比较的内容。
+
+    返回:
+        如果文件存在且内容相同，返回 True。
+    """
+    try:
+        size = os.stat(path).st_size
+        if size != len(payload):
+            return False
+        return _read_file(path, size) == payload
+    except FileNotFoundError:
+        return False
+
+
+@dataclass(frozen=True)
+class _ParsedFile:
+    """单个 YAML 文件的解析缓存项。
+
+    缓存项不可变，更新时整体替换。目录中的文件是串行解析的，但同一个
+    配置源可能被多个 ConfigManager（各自持有独立的写锁）共享或被直接
+    从多个线程调用，并发读取不同或相同文件时不会看到字段不一致的缓存项，
+    也无需为缓存加锁。
+
+    属性:
+        mtime_ns: 解析时文件的修改时间（纳秒）。
+        size: 解析时文件的大小。
+        inode: 解析时文件的 inode 编号。
+        digest: 文件内容的 BLAKE2b 摘要。
+        content: 解析结果。
+    """
+
+    mtime_ns: int
+    size: int
+    inode: int
+    digest: bytes
+    content: dict[str, Any]
+
+
 class YamlConfigSource(ConfigSource):
     """YAML 文件的配置源。
 
     使用 PyYAML 读写配置文件。
-    支持安全加载，并尽可能保留格式。
+    支持安全加载（libyaml 可用时使用 C 实现），并尽可能保留格式。
+
+    解析结果按文件缓存：(mtime, size, inode) 未变时直接复用；
+    元数据变化但内容摘要相同（例如 touch、rsync）时也不重新解析。
     """
 
+    def __init__(self):
+        """初始化配置源。"""
+        self._parse_cache: dict[Path, _ParsedFile] = {}
+
     def read(self, path: Path, base_path: Optional[Path] = None) -> dict[str, Any]:
         """从 YAML 文件读取配置。
 
@@ -33,24 +143,92 @@ class YamlConfigSource(ConfigSource):
             yaml.YAMLError: 如果文件不是有效的 YAML。
         """
         resolved_path = self._resolve_path(path, base_path)
-
-        if not resolved_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {resolved_path}")
+        yaml, _, _ = _yaml()
 
         try:
-            with open(resolved_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            if data is None:
-                data = {}
+            data = self._load_cached(resolved_path)
 
             logger.info(f"Loaded configuration from {resolved_path}")
             return data
 
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Configuration file not found: {resolved_path}"
+            ) from None
+
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse YAML file {resolved_path}: {e}")
             raise
 
+    def _load_cached(self, path: Path) -> dict[str, Any]:
+        """读取并解析 YAML 文件，命中缓存时跳过解析。
+
+        参数:
+            path: 已解析的 YAML 文件绝对路径。
+
+        返回:
+            解析结果的副本，调用方可以自由修改。
+        """
+        # 一次 os.stat 同时完成存在性检查和缓存校验
+        st = os.stat(path)
+        entry = self._parse_cache.get(path)
+        if entry is not None and (
+            entry.mtime_ns == st.st_mtime_ns
+            and entry.size == st.st_size
+            and entry.inode == st.st_ino
+        ):
+            return copy_tree(entry.content)
+
+        if st.st_size >= _MMAP_THRESHOLD:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                return self._load_content(path, st, entry, raw)
+
+        return self._load_content(path, st, entry, _read_file(path, st.st_size))
+
+    def _load_content(
+        self,
+        path: Path,
+        st: os.stat_result,
+        entry: Optional[_ParsedFile],
+        raw: bytes | mmap.mmap,
+    ) -> dict[str, Any]:
+        """按内容摘要复用或重新解析文件内容，并更新缓存。
+
+        参数:
+            path: 已解析的 YAML 文件绝对路径。
+            st: 文件的 stat 结果。
+            entry: 该文件原有的缓存项，没有时为 None。
+            raw: 文件内容，大文件为只读内存映射。
+
+        返回:
+            解析结果的副本，调用方可以自由修改。
+        """
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        if entry is not None and entry.digest == digest:
+            # 仅元数据变化，内容未变
+            self._parse_cache[path] = replace(
+                entry, mtime_ns=st.st_mtime_ns, size=st.st_size, inode=st.st_ino
+            )
+            logger.debug(f"Content unchanged, reusing parsed {path}")
+            return copy_tree(entry.content)
+
+        # 直接把字节交给解析器，由 libyaml 在 C 层完成 UTF-8 解码；
+        # 内存映射则作为二进制流按块读取
+        yaml, loader, _ = _yaml()
+        content = yaml.load(raw, Loader=loader)
+        content = intern_keys(content) if content is not None else {}
+
+        self._parse_cache[path] = _ParsedFile(
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            inode=st.st_ino,
+            digest=digest,
+            content=content,
+        )
+        return copy_tree(content)
+
     def write(self, path: Path, config: dict[str, Any],
               base_path: Optional[Path] = None) -> None:
         """将配置写入 YAML 文件。
@@ -66,10 +244,19 @@ class YamlConfigSource(ConfigSource):
         resolved_path = self._resolve_path(path, base_path)
         resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # 指定 encoding 时由生成器直接输出 UTF-8 字节，无需再在 Python 层编码一遍
+        yaml, _, dumper = _yaml()
+        payload = yaml.dump(config, Dumper=dumper, default_flow_style=False,
+                            allow_unicode=True, sort_keys=False, encoding='utf-8')
+
         try:
-            with open(resolved_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(config, f, default_flow_style=False,
-                              allow_unicode=True, sort_keys=False)
+            # 内容未变时不写文件，避免无谓的 IO、mtime 变化和随之触发的重载
+            if _has_content(resolved_path, payload):
+                logger.debug(f"Configuration unchanged, skipped writing {resolved_path}")
+                return
+
+            with open(resolved_path, 'wb') as f:
+                f.write(payload)
 
             logger.info(f"Wrote configuration to {resolved_path}")
 
@@ -1,10 +1,76 @@
-import fnmatch
+import errno
 import os
+import queue
+import stat
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .config import TraversalOptions
 from .filters import PathFilter
+from .sorting import _STAT_SORT_ATTRS
+
+_StatItem = tuple[Path | str, os.stat_result | None]
+# 内部生成器产出的元素：保留 stat 时为 (路径, stat)，否则直接是路径；
+# options.as_str 为 True 时路径为字符串
+_Item = Path | str | _StatItem
+
+
+def _inode_key(entry: os.DirEntry) -> int:
+    """DirEntry 的 inode 号；Linux 上由 getdents64 直接给出，无需额外系统调用。"""
+    try:
+        return entry.inode()
+    except OSError:
+        # Windows 上 inode() 需要额外 stat，可能失败；此时保持原有顺序
+        return 0
+
+
+# POSIX 上用目录 fd 调用 os.scandir，DirEntry.stat()/is_dir() 随之以 fstatat
+# 相对该 fd 执行，内核无需为每个条目重新解析整条路径；深层目录树和
+# NFS 上收益最大。不支持的平台（Windows）退回按路径扫描
+_SCANDIR_FD = os.scandir in os.supports_fd and hasattr(os, "O_DIRECTORY")
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+
+
+def _open_dir(root: str) -> int | None:
+    """打开目录用于 fd 相对扫描；平台不支持时返回 None。"""
+    return os.open(root, _DIR_FLAGS) if _SCANDIR_FD else None
+
+
+def _close_dir(fd: int | None) -> None:
+    if fd is not None:
+        os.close(fd)
+
+
+class _DirScan(t.NamedTuple):
+    """一次目录扫描的结果。条目的 stat 依赖 fd，用完后须调用 close()。"""
+
+    root: str
+    fd: int | None
+    dirs: list[os.DirEntry]
+    files: list[os.DirEntry]
+
+    def close(self) -> None:
+        _close_dir(self.fd)
+
+
+def _scan_dir(root: str) -> _DirScan:
+    """扫描一个目录，按是否为目录（跟随符号链接）把条目分为两组。"""
+    dirs: list[os.DirEntry] = []
+    files: list[os.DirEntry] = []
+    fd = _open_dir(root)
+    try:
+        with os.scandir(root if fd is None else fd) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (dirs if is_dir else files).append(entry)
+    except BaseException:
+        _close_dir(fd)
+        raise
+    return _DirScan(root, fd, dirs, files)
 
 
 class PathCollector:
@@ -14,35 +80,67 @@ class PathCollector:
         self,
         options: TraversalOptions,
         path_filter: PathFilter,
-        errors: list[tuple[Path, Exception]] | None = None,
+        errors: t.MutableSequence[tuple[Path, Exception]] | None = None,
     ) -> None:
         self._options = options
         self._filter = path_filter
         self._errors = errors if errors is not None else []
+        # 错误处理用到的方法和回调在构造时绑定，记录错误时不再逐层查找属性
+        self._record_error = self._errors.append
+        self._error_handler = options.error_handler
+        # 按 stat 字段排序时，在遍历中顺带保留条目的 stat 结果供排序复用
+        self._keep_stat = options.sort_by in _STAT_SORT_ATTRS
 
     @property
-    def errors(self) -> list[tuple[Path, Exception]]:
+    def errors(self) -> t.MutableSequence[tuple[Path, Exception]]:
         return self._errors
 
-    def collect(self, paths: t.Iterable[Path | str]) -> t.Iterable[Path]:
+    def collect(self, paths: t.Iterable[Path | str]) -> t.Iterable[Path | str]:
+        if self._keep_stat:
+            return (path for path, _ in self._collect(paths))
+        # 常见情况下直接返回内部生成器，每个结果少经过一层生成器
+        return self._collect(paths)
+
+    def collect_with_stat(self, paths: t.Iterable[Path | str]) -> t.Iterable[_StatItem]:
+        """与 collect 相同，但同时给出每个路径的 stat 结果。
+
+        只有 options.sort_by 为 SIZE/MTIME/CTIME 时才会带上 stat，其余情况为 None；
+        scandir 条目的 stat 由 DirEntry 缓存，过滤时已取过的不会再次系统调用。
+        """
+        if self._keep_stat:
+            return self._collect(paths)
+        return ((path, None) for path in self._collect(paths))
+
+    def _collect(self, paths: t.Iterable[Path | str]) -> t.Iterator[_Item]:
         count = 0
 
         for raw_path in paths:
             path = Path(raw_path)
 
-            if not path.exists():
+            # 一次 stat 同时判断存在性和类型，文件根路径的过滤与排序也复用它。
+            # 只有路径不存在（或含 NUL 等无法表示的字符）时记为 FileNotFoundError，
+            # 权限、符号链接循环、路径过长等错误原样记录，保留真实原因
+            try:
+                st = os.stat(path)
+            except ValueError:
                 self._handle_error(path, FileNotFoundError(path))
                 continue
+            except OSError as exc:
+                if exc.errno == errno.ENOENT:
+                    exc = FileNotFoundError(path)
+                self._handle_error(path, exc)
+                continue
 
             try:
-                if path.is_file():
-                    if not self._options.dir_only and self._filter(path):
+                if stat.S_ISREG(st.st_mode):
+                    if not self._options.dir_only and self._filter.accept_file(path, st):
                         count += 1
                         self._notify_progress(count)
-                        yield path
+                        item_path = os.fspath(path) if self._options.as_str else path
+                        yield (item_path, st) if self._keep_stat else item_path
                     continue
 
-                if not path.is_dir():
+                if not stat.S_ISDIR(st.st_mode):
                     continue
 
                 if self._options.recursive:
@@ -52,79 +150,233 @@ class PathCollector:
             except OSError as exc:
                 self._handle_error(path, exc)
 
+        # 按间隔通知时，收集结束后补一次最终计数
+        if self._options.progress_callback and count % self._options.progress_interval:
+            self._options.progress_callback(count)
+
     def _notify_progress(self, count: int) -> None:
-        if self._options.progress_callback:
+        if self._options.progress_callback and not count % self._options.progress_interval:
             self._options.progress_callback(count)
 
     def _handle_error(self, path: Path, error: Exception) -> None:
-        self._errors.append((path, error))
-        if self._options.error_handler:
-            self._options.error_handler(path, error)
+        self._record_error((path, error))
+        if self._error_handler:
+            self._error_handler(path, error)
+        # 记录的异常不再需要回溯，去掉后不会让遍历的栈帧及其中的 DirEntry 等常驻内存
+        error.__traceback__ = None
+
+    def _entry_stat(self, entry: os.DirEntry) -> os.stat_result | None:
+        try:
+            return entry.stat()
+        except OSError:
+            return None
 
-    def _yield_flat(self, path: Path, count: int) -> t.Generator[Path, None, int]:
+    def _yield_flat(self, path: Path, count: int) -> t.Generator[_Item, None, int]:
+        root = os.fspath(path)
         try:
-            with os.scandir(path) as entries:
+            fd = _open_dir(root)
+        except OSError as exc:
+            self._handle_error(path, exc)
+            return count
+
+        # 逐条目循环中用到的配置和方法先绑定为局部变量
+        dir_only = self._options.dir_only
+        progress = self._options.progress_callback
+        interval = self._options.progress_interval
+        keep_stat = self._keep_stat
+        as_str = self._options.as_str
+        accepts_all = self._filter.accepts_all
+        match_name = self._filter.match_name
+        accept_entry = self._filter.accept_entry
+
+        try:
+            with os.scandir(root if fd is None else fd) as entries:
                 for entry in entries:
-                    entry_path = Path(entry.path)
                     try:
-                        if self._options.dir_only:
+                        if dir_only:
                             is_target = entry.is_dir(follow_symlinks=False)
                         else:
                             is_target = entry.is_file(follow_symlinks=False)
 
-                        if is_target and self._filter(entry_path):
-                            count += 1
-                            self._notify_progress(count)
-                            yield entry_path
+                        if not is_target:
+                            continue
+
+                        if accepts_all:
+                            item_path = os.path.join(root, entry.name)
+                            if not as_str:
+                                item_path = Path(item_path)
+                        else:
+                            # 先按名称过滤，只为通过的条目构造 Path
+                            if not match_name(entry.name):
+                                continue
+                            item_path = accept_entry(
+                                entry, root, is_file=not dir_only, as_str=as_str
+                            )
+                            if item_path is None:
+                                continue
+
+                        count += 1
+                        if progress and not count % interval:
+                            progress(count)
+                        yield (item_path, self._entry_stat(entry)) if keep_stat else item_path
                     except OSError as exc:
-                        self._handle_error(entry_path, exc)
+                        self._handle_error(Path(root, entry.name), exc)
         except OSError as exc:
             self._handle_error(path, exc)
+        finally:
+            _close_dir(fd)
 
         return count
 
     def _should_descend(self, dir_name: str) -> bool:
-        if not self._filter.rules.excludes:
-            return True
+        return not self._filter.is_excluded(dir_name)
 
-        return not any(
-            fnmatch.fnmatch(dir_name, pat) for pat in self._filter.rules.excludes
-        )
+    def _prune_dirs(self, dirs: list[os.DirEntry], depth: int) -> list[os.DirEntry]:
+        """返回需要继续进入的子目录。"""
+        if depth >= self._options.max_depth:
+            return []
+        if self._filter.rules.excludes:
+            return [entry for entry in dirs if self._should_descend(entry.name)]
+        return dirs
 
-    def _yield_recursive(self, path: Path, count: int) -> t.Generator[Path, None, int]:
-        try:
-            for root, dirs, files in os.walk(path):
-                rp = Path(root)
+    def _emit_entries(
+        self, root: str, entries: list[os.DirEntry], count: int
+    ) -> t.Generator[_Item, None, int]:
+        keep_stat = self._keep_stat
+        progress = self._options.progress_callback
+        if self._filter.accepts_all and not keep_stat and not progress:
+            # 没有任何过滤规则、也不需要 stat 和进度时，直接为每个条目构造 Path
+            join = os.path.join
+            if self._options.as_str:
+                for entry in entries:
+                    yield join(root, entry.name)
+            else:
+                for entry in entries:
+                    yield Path(join(root, entry.name))
+            return count + len(entries)
 
-                try:
-                    depth = len(rp.relative_to(path).parts) if rp != path else 0
-                except ValueError:
-                    continue
-                if depth > self._options.max_depth:
-                    continue
-                if depth == self._options.max_depth:
-                    dirs.clear()
+        dir_only = self._options.dir_only
+        # 只有大小、时间规则需要区分文件；否则不必查询条目类型
+        check_file = not dir_only and self._filter.needs_stat
+        # dir_only 时输出的目录已在 _prune_dirs 中排除过 excludes，这里只需匹配 patterns
+        match_name = self._filter.match_include if dir_only else self._filter.match_name
+        accept_entry = self._filter.accept_entry
+        as_str = self._options.as_str
+        interval = self._options.progress_interval
+        for entry in entries:
+            if not match_name(entry.name):
+                continue
+
+            try:
+                item_path = accept_entry(
+                    entry, root, is_file=check_file and entry.is_file(), as_str=as_str
+                )
+                if item_path is not None:
+                    count += 1
+                    if progress and not count % interval:
+                        progress(count)
+                    yield (item_path, self._entry_stat(entry)) if keep_stat else item_path
+            except OSError as exc:
+                self._handle_error(Path(root, entry.name), exc)
 
-                if self._filter.rules.excludes:
-                    dirs[:] = [d for d in dirs if self._should_descend(d)]
+        return count
 
-                items = dirs if self._options.dir_only else files
+    def _yield_recursive(self, path: Path, count: int) -> t.Generator[_Item, None, int]:
+        if self._options.workers > 0:
+            return (yield from self._yield_parallel(path, count))
 
-                for name in items:
-                    item_path = rp / name
-                    item_depth = depth + 1 if self._options.dir_only else depth
+        # 显式栈上的 os.scandir 深度优先遍历：深度用整数记录，
+        # DirEntry 一直保留到过滤阶段，类型与 stat 信息无需重新获取
+        dir_only = self._options.dir_only
+        stack = [(os.fspath(path), 0)]
 
-                    try:
-                        if item_depth <= self._options.max_depth and self._filter(
-                            item_path
-                        ):
-                            count += 1
-                            self._notify_progress(count)
-                            yield item_path
-                    except OSError as exc:
-                        self._handle_error(item_path, exc)
-        except OSError as exc:
-            self._handle_error(path, exc)
+        while stack:
+            root, depth = stack.pop()
+            try:
+                scan = _scan_dir(root)
+            except OSError as exc:
+                self._handle_error(Path(root), exc)
+                continue
+
+            try:
+                dirs = self._prune_dirs(scan.dirs, depth)
+                count = yield from self._emit_entries(
+                    root, dirs if dir_only else scan.files, count
+                )
+
+                # 与 os.walk 一致：符号链接指向的目录会被列出，但不进入。
+                # 同级子目录按 inode 升序进入（栈中逆序压入），
+                # 在机械盘和大型 ext4 目录树上可减少随机寻道
+                subdirs = [entry for entry in dirs if not entry.is_symlink()]
+            finally:
+                scan.close()
+
+            subdirs.sort(key=_inode_key, reverse=True)
+            stack.extend((os.path.join(root, entry.name), depth + 1) for entry in subdirs)
+
+        return count
+
+    def _yield_parallel(self, path: Path, count: int) -> t.Generator[_Item, None, int]:
+        # 工作线程只负责 scandir 与条目分类，结果经队列交回调用方线程；
+        # 过滤、进度回调和错误处理仍在调用方线程中执行，行为与串行遍历一致，
+        # 只是输出顺序取决于各目录扫描完成的先后。
+        # 每个已提交的扫描在调用方处理完之前都占用一个目录 fd，
+        # 因此同时在途的扫描数限制为线程数的两倍，其余子目录先留在待扫描栈中，
+        # 否则宽目录树会一次性打开成千上万个 fd 并触发 EMFILE
+        dir_only = self._options.dir_only
+        workers = self._options.workers
+        max_in_flight = workers * 2
+        results: queue.SimpleQueue = queue.SimpleQueue()
+        backlog = [(os.fspath(path), 0)]
+
+        def scan(root: str, depth: int) -> None:
+            try:
+                results.put((root, depth, _scan_dir(root), None))
+            except Exception as exc:
+                results.put((root, depth, None, exc))
+
+        def fill() -> None:
+            nonlocal pending
+            while backlog and pending < max_in_flight:
+                pool.submit(scan, *backlog.pop())
+                pending += 1
+
+        pending = 0
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="path-gatherer")
+        try:
+            fill()
+            while pending:
+                root, depth, scanned, exc = results.get()
+                pending -= 1
+                if exc is not None:
+                    if not isinstance(exc, OSError):
+                        raise exc
+                    self._handle_error(Path(root), exc)
+                    fill()
+                    continue
+
+                try:
+                    dirs = self._prune_dirs(scanned.dirs, depth)
+                    backlog.extend(
+                        (os.path.join(root, entry.name), depth + 1)
+                        for entry in dirs
+                        if not entry.is_symlink()
+                    )
+                    # 先补足在途扫描再输出本目录条目，让工作线程与调用方并行
+                    fill()
+
+                    count = yield from self._emit_entries(
+                        root, dirs if dir_only else scanned.files, count
+                    )
+                finally:
+                    scanned.close()
+        finally:
+            # 调用方提前停止迭代时，丢弃尚未开始的扫描，并关闭已完成扫描的目录 fd
+            pool.shutdown(wait=True, cancel_futures=True)
+            while not results.empty():
+                _, _, scanned, _ = results.get()
+                if scanned is not None:
+                    scanned.close()
 
         return count
 
@@ -5,7 +5,7 @@ import typing as t
 from .sorting import SortBy
 
 
-@dataclass
+@dataclass(slots=True)
 class GatherConfig:
     """路径收集配置类。
 
@@ -24,7 +24,11 @@ class GatherConfig:
     mtime_after: float | None = None
     mtime_before: float | None = None
     progress_callback: t.Callable[[int], None] | None = None
+    progress_interval: int = 1
     error_handler: t.Callable[[Path, Exception], None] | None = None
+    workers: int = 0
+    as_str: bool = False
+    max_errors: int | None = 10_000
 
 
 @dataclass(frozen=True)
@@ -56,7 +60,10 @@ class TraversalOptions:
     sort_by: SortBy | None = None
     sort_reverse: bool = False
     progress_callback: t.Callable[[int], None] | None = None
+    progress_interval: int = 1
     error_handler: t.Callable[[Path, Exception], None] | None = None
+    workers: int = 0
+    as_str: bool = False
 
 
 __all__ = [
@@ -1,52 +1,177 @@
 import fnmatch
+import functools
+import operator
+import os
+import re
+import typing as t
 from pathlib import Path
 
 from .config import FilterRules
 
+# fnmatch 会先对名称和模式做 os.path.normcase（Windows 上转为小写）。
+# 这里在编译时完成：正则使用 IGNORECASE，字面量预先转为小写，
+# 逐条目时不再对名称做 normcase
+_NORMCASE = os.path.normcase("A") != "A"
+_GLOB_FLAGS = re.IGNORECASE if _NORMCASE else 0
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+class _Globs(t.NamedTuple):
+    """编译后的一组 glob 模式：不含通配符的模式直接做集合查找，其余合并为一个正则。"""
+
+    literals: frozenset[str]
+    regex: re.Pattern[str] | None
+
+    def match(self, name: str) -> bool:
+        if (name.lower() if _NORMCASE else name) in self.literals:
+            return True
+        return self.regex is not None and self.regex.match(name) is not None
+
+    def matcher(self) -> t.Callable[[str], bool]:
+        """返回针对实际模式组成的最快匹配函数。"""
+        if self.regex is None:
+            if _NORMCASE:
+                literals = self.literals
+                return lambda name: name.lower() in literals
+            return self.literals.__contains__
+        if not self.literals:
+            regex_match = self.regex.match
+            return lambda name: regex_match(name) is not None
+        return self.match
+
+
+def _compile_globs(patterns: tuple[str, ...]) -> _Globs | None:
+    """编译一组 glob 模式，匹配任一模式即命中；没有模式时返回 None。"""
+    if not patterns:
+        return None
+
+    literals = set()
+    globs = []
+    for pat in patterns:
+        pat = os.path.normcase(pat)
+        if _GLOB_MAGIC.search(pat):
+            globs.append(f"(?:{fnmatch.translate(pat)})")
+        else:
+            literals.add(pat)
+
+    return _Globs(
+        literals=frozenset(literals),
+        regex=re.compile("|".join(globs), _GLOB_FLAGS) if globs else None,
+    )
+
+
+def _make_name_matcher(
+    includes: _Globs | None, excludes: _Globs | None
+) -> t.Callable[[str], bool]:
+    """按实际存在的规则组合名称匹配函数，逐条目时不再判断未设置的规则。"""
+    if includes is None and excludes is None:
+        return lambda name: True
+
+    if excludes is None:
+        return includes.matcher()
+    if includes is None:
+        exclude = excludes.matcher()
+        return lambda name: not exclude(name)
+
+    include, exclude = includes.matcher(), excludes.matcher()
+    return lambda name: include(name) and not exclude(name)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_name_rules(
+    patterns: tuple[str, ...], excludes: tuple[str, ...]
+) -> tuple[_Globs | None, _Globs | None, t.Callable[[str], bool]]:
+    """编译 patterns/excludes 及对应的名称匹配函数。
+
+    编译结果不可变，可在多个 PathFilter 之间共享；重复使用同一个 PathGatherer
+    或多个收集器使用相同模式时，无需再次翻译和编译正则。
+    """
+    includes = _compile_globs(patterns)
+    exclude_globs = _compile_globs(excludes)
+    return includes, exclude_globs, _make_name_matcher(includes, exclude_globs)
+
+
+def _make_range_check(
+    attr: str, low: float | None, high: float | None
+) -> t.Callable[[os.stat_result], bool] | None:
+    """生成检查 stat 字段是否落在 [low, high] 内的函数；两端都未设置时返回 None。"""
+    get = operator.attrgetter(attr)
+    if low is None and high is None:
+        return None
+    if high is None:
+        return lambda stat: get(stat) >= low
+    if low is None:
+        return lambda stat: get(stat) <= high
+    return lambda stat: low <= get(stat) <= high
+
+
+def _make_stat_matcher(
+    rules: FilterRules,
+) -> t.Callable[[os.stat_result], bool] | None:
+    """按实际设置的大小、时间规则组合 stat 检查函数；都未设置时返回 None。"""
+    size_ok = _make_range_check("st_size", rules.size_min, rules.size_max)
+    mtime_ok = _make_range_check("st_mtime", rules.mtime_after, rules.mtime_before)
+
+    if size_ok and mtime_ok:
+        return lambda stat: size_ok(stat) and mtime_ok(stat)
+    return size_ok or mtime_ok
+
 
 class PathFilter:
-    """路径过滤器类。"""
+    """路径过滤器类。
+
+    构造时按实际设置的规则特化出谓词：match_name(name) 只按名称检查
+    patterns/excludes，无需构造 Path；未设置的规则不会在逐条目时再被判断。
+    """
 
     def __init__(self, rules: FilterRules, *, dir_only: bool) -> None:
         self._rules = rules
         self._dir_only = dir_only
+        # 在构造时按实际规则特化出谓词，热路径上不再逐条判断空规则
+        self._includes, self._excludes, self.match_name = _compile_name_rules(
+            rules.patterns, rules.excludes
+        )
+        # 只检查 patterns，供已按 excludes 剪枝过的目录名使用，避免重复匹配 excludes
+        self.match_include = (
+            self._includes.matcher() if self._includes is not None else lambda name: True
+        )
+        # 没有大小、时间规则时为 None，此时完全不需要 stat
+        self._match_stat = _make_stat_matcher(rules)
+        # 未设置任何规则时，收集器可跳过逐条目的过滤调用
+        self.accepts_all = (
+            self._includes is None
+            and self._excludes is None
+            and self._match_stat is None
+            and rules.custom is None
+        )
 
     @property
     def rules(self) -> FilterRules:
         return self._rules
 
-    def __call__(self, path: Path) -> bool:
-        name = path.name
+    @property
+    def needs_stat(self) -> bool:
+        """是否设置了需要 stat 的大小或时间规则。"""
+        return self._match_stat is not None
 
-        if self._rules.patterns and not any(
-            fnmatch.fnmatch(name, pat) for pat in self._rules.patterns
-        ):
-            return False
+    def __call__(self, path: Path) -> bool:
+        return self.match_name(path.name) and self.match_path(path)
 
-        if self._rules.excludes and any(
-            fnmatch.fnmatch(name, pat) for pat in self._rules.excludes
-        ):
+    def is_excluded(self, name: str) -> bool:
+        """名称是否命中 excludes。"""
+        if self._excludes is None:
             return False
+        return self._excludes.match(name)
 
-        if path.is_file() and not self._dir_only:
+    def match_path(self, path: Path) -> bool:
+        """检查名称以外的规则（大小、时间、自定义函数）。"""
+        if self._match_stat is not None and not self._dir_only and path.is_file():
             try:
                 stat = path.stat()
             except OSError:
                 return False
 
-            if self._rules.size_min is not None and stat.st_size < self._rules.size_min:
-                return False
-            if self._rules.size_max is not None and stat.st_size > self._rules.size_max:
-                return False
-            if (
-                self._rules.mtime_after is not None
-                and stat.st_mtime < self._rules.mtime_after
-            ):
-                return False
-            if (
-                self._rules.mtime_before is not None
-                and stat.st_mtime > self._rules.mtime_before
-            ):
+            if not self._match_stat(stat):
                 return False
 
         if self._rules.custom and not self._rules.custom(path):
@@ -54,5 +179,42 @@ class PathFilter:
 
         return True
 
+    def accept_file(self, path: Path, stat: os.stat_result) -> bool:
+        """检查已知为普通文件、且已取得 stat 结果的路径，不再重复 stat。"""
+        if not self.match_name(path.name):
+            return False
+        if self._match_stat is not None and not self._dir_only and not self._match_stat(stat):
+            return False
+        return not (self._rules.custom and not self._rules.custom(path))
+
+    def accept_entry(
+        self, entry: os.DirEntry, root: str, *, is_file: bool, as_str: bool = False
+    ) -> Path | str | None:
+        """检查名称已通过 match_name 的 scandir 条目，通过时返回其路径。
+
+        root 为条目所在目录（按目录 fd 扫描时 entry.path 只是名称），
+        完整路径只在大小、时间检查通过后才构造；as_str 为 True 时返回路径字符串，
+        只有设置了自定义过滤函数时才为其构造 Path。
+        is_file 由调用方根据 scandir 的类型信息给出，无需再次 stat 判断类型；
+        大小与时间取自 entry.stat()，Windows 上直接使用目录项缓存。
+        """
+        if is_file and self._match_stat is not None and not self._dir_only:
+            try:
+                stat = entry.stat()
+            except OSError:
+                return None
+
+            if not self._match_stat(stat):
+                return None
+
+        entry_path = os.path.join(root, entry.name)
+        if self._rules.custom:
+            path = Path(entry_path)
+            if not self._rules.custom(path):
+                return None
+            return entry_path if as_str else path
+
+        return entry_path if as_str else Path(entry_path)
+
 
 __all__ = ["PathFilter"]
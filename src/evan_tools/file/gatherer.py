@@ -1,11 +1,13 @@
 import sys
 import typing as t
+from collections import deque
+from collections.abc import Sequence
 from pathlib import Path
 
 from .collector import PathCollector
 from .config import GatherConfig, FilterRules, TraversalOptions
 from .filters import PathFilter
-from .sorting import SortBy, _make_sort_key
+from .sorting import _STAT_SORT_ATTRS, SortBy, _make_sort_key, _make_stat_sort_key
 
 
 def _process_depth(deep: bool | int) -> tuple[int, bool]:
@@ -16,13 +18,47 @@ def _process_depth(deep: bool | int) -> tuple[int, bool]:
     return deep, True
 
 
+class _ErrorsView(Sequence):
+    """PathGatherer 错误记录的只读实时视图，访问时不复制。"""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "PathGatherer") -> None:
+        # 引用收集器本身而不是错误容器，max_errors() 替换容器后视图依然有效
+        self._owner = owner
+
+    def __getitem__(self, index):
+        errors = self._owner._errors
+        if isinstance(index, slice):
+            return list(errors)[index]
+        return errors[index]
+
+    def __len__(self) -> int:
+        return len(self._owner._errors)
+
+    def __iter__(self) -> t.Iterator[tuple[Path, Exception]]:
+        return iter(self._owner._errors)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (_ErrorsView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class PathGatherer:
     """路径收集器 - 链式调用构建器。"""
 
     def __init__(self, paths: t.Iterable[Path | str], *, deep: bool | int = False):
         self._paths = [Path(p) for p in paths]
         self._config = GatherConfig(deep=deep)
-        self._errors: list[tuple[Path, Exception]] = []
+        # 只保留最近 max_errors 条错误，大量无权限目录不会让错误记录无限增长
+        self._errors: deque[tuple[Path, Exception]] = deque(
+            maxlen=self._config.max_errors
+        )
+        self._errors_view = _ErrorsView(self)
 
     def pattern(self, *patterns: str) -> "PathGatherer":
         self._config.patterns.extend(patterns)
@@ -55,15 +91,42 @@ class PathGatherer:
             self._config.mtime_before = mtime_before
         return self
 
-    def on_progress(self, callback: t.Callable[[int], None]) -> "PathGatherer":
+    def on_progress(
+        self, callback: t.Callable[[int], None], *, interval: int = 1
+    ) -> "PathGatherer":
+        if interval < 1:
+            raise ValueError(f"interval must be >= 1, got {interval}")
         self._config.progress_callback = callback
+        self._config.progress_interval = interval
+        return self
+
+    def workers(self, count: int) -> "PathGatherer":
+        if count < 0:
+            raise ValueError(f"workers must be >= 0, got {count}")
+        self._config.workers = count
+        return self
+
+    def max_errors(self, count: int | None) -> "PathGatherer":
+        if count is not None and count < 0:
+            raise ValueError(f"max_errors must be >= 0 or None, got {count}")
+        self._config.max_errors = count
+        self._errors = deque(self._errors, maxlen=count)
+        return self
+
+    def as_str(self) -> "PathGatherer":
+        """让 gather() 产出路径字符串而不是 Path，省去每个结果的 Path 构造。"""
+        self._config.as_str = True
         return self
 
     @property
-    def errors(self) -> list[tuple[Path, Exception]]:
-        return self._errors.copy()
+    def errors(self) -> t.Sequence[tuple[Path, Exception]]:
+        """收集过程中遇到的错误，只读视图，随收集进行实时更新。
+
+        最多保留最近 max_errors 条（默认 10000），为 None 时不限制。
+        """
+        return self._errors_view
 
-    def gather(self) -> t.Iterable[Path]:
+    def gather(self) -> t.Iterable[Path | str]:
         max_depth, recursive = _process_depth(self._config.deep)
         options = TraversalOptions(
             max_depth=max_depth,
@@ -72,7 +135,10 @@ class PathGatherer:
             sort_by=self._config.sort_by,
             sort_reverse=self._config.sort_reverse,
             progress_callback=self._config.progress_callback,
+            progress_interval=self._config.progress_interval,
             error_handler=self._config.error_handler,
+            workers=self._config.workers,
+            as_str=self._config.as_str,
         )
         rules = FilterRules(
             patterns=tuple(self._config.patterns),
@@ -85,15 +151,25 @@ class PathGatherer:
         )
         path_filter = PathFilter(rules, dir_only=self._config.dir_only)
         collector = PathCollector(options, path_filter, errors=self._errors)
-        collected = collector.collect(self._paths)
 
-        if self._config.sort_by:
+        if self._config.sort_by in _STAT_SORT_ATTRS:
+            # 使用遍历时取得的 stat 排序，避免对每个结果再 stat 一次
+            items = list(collector.collect_with_stat(self._paths))
+            items.sort(
+                key=_make_stat_sort_key(self._config.sort_by),
+                reverse=self._config.sort_reverse,
+            )
+            yield from (path for path, _ in items)
+        elif self._config.sort_by:
             sort_key = _make_sort_key(self._config.sort_by)
-            collected_list = list(collected)
+            if self._config.as_str:
+                path_key = sort_key
+                sort_key = lambda path: path_key(Path(path))  # noqa: E731
+            collected_list = list(collector.collect(self._paths))
             collected_list.sort(key=sort_key, reverse=self._config.sort_reverse)
             yield from collected_list
         else:
-            yield from collected
+            yield from collector.collect(self._paths)
 
 
 def gather_paths(
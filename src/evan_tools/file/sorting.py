@@ -1,3 +1,4 @@
+import os
 import typing as t
 from enum import Enum
 from pathlib import Path
@@ -13,27 +14,54 @@ class SortBy(Enum):
     EXTENSION = "ext"
 
 
+# 需要 stat 的排序方式及其对应的 stat_result 字段
+_STAT_SORT_ATTRS = {
+    SortBy.SIZE: "st_size",
+    SortBy.MTIME: "st_mtime",
+    SortBy.CTIME: "st_ctime",
+}
+
+
+def _name_key(path: Path) -> str:
+    return path.name.lower()
+
+
+def _extension_key(path: Path) -> str:
+    return path.suffix.lower()
+
+
 def _make_sort_key(sort_by: SortBy | None) -> t.Callable[[Path], t.Any]:
-    """创建排序键函数。"""
+    """创建排序键函数。
 
-    def _sort_key(path: Path) -> t.Any:
+    按 sort_by 直接返回对应的键函数，排序时每个元素不再分派 SortBy。
+    """
+    if sort_by == SortBy.NAME:
+        return _name_key
+    if sort_by == SortBy.EXTENSION:
+        return _extension_key
+    if sort_by not in _STAT_SORT_ATTRS:
+        return lambda path: 0
+
+    attr = _STAT_SORT_ATTRS[sort_by]
+
+    def _stat_key(path: Path) -> t.Any:
         try:
-            if sort_by == SortBy.NAME:
-                return path.name.lower()
-            if sort_by == SortBy.EXTENSION:
-                return path.suffix.lower()
-
-            stat = path.stat()
-            if sort_by == SortBy.SIZE:
-                return stat.st_size
-            if sort_by == SortBy.MTIME:
-                return stat.st_mtime
-            if sort_by == SortBy.CTIME:
-                return stat.st_ctime
+            return getattr(path.stat(), attr)
         except OSError:
             return 0
 
-        return 0
+    return _stat_key
+
+
+def _make_stat_sort_key(
+    sort_by: SortBy,
+) -> t.Callable[[tuple[Path, os.stat_result | None]], t.Any]:
+    """为 (路径, stat) 对创建排序键函数，直接使用遍历时取得的 stat，不再系统调用。"""
+    attr = _STAT_SORT_ATTRS[sort_by]
+
+    def _sort_key(item: tuple[Path, os.stat_result | None]) -> t.Any:
+        stat = item[1]
+        return getattr(stat, attr) if stat is not None else 0
 
     return _sort_key
 
@@ -41,4 +69,5 @@ def _make_sort_key(sort_by: SortBy | None) -> t.Callable[[Path], t.Any]:
 __all__ = [
     "SortBy",
     "_make_sort_key",
+    "_make_stat_sort_key",
 ]
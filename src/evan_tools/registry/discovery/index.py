@@ -13,32 +13,37 @@ class CommandIndex:
         """初始化索引与检查器。"""
         self._inspector = CommandInspector()
         self._metadata_cache: list[CommandMetadata] | None = None
+        # 与 _metadata_cache 一同重建的按名称、按分组索引
+        self._by_name: dict[str, CommandMetadata] = {}
+        self._by_group: dict[str | None, list[CommandMetadata]] = {}
     
-    def get_all_commands(self) -> list[CommandMetadata]:
-        """获取已注册的全部命令元数据列表。"""
+    def _ensure_cache(self) -> list[CommandMetadata]:
+        """返回元数据缓存，必要时先重建（返回内部列表，调用方不得修改）。"""
         if self._metadata_cache is None:
             self._rebuild_cache()
-        return list(self._metadata_cache or [])
+        return self._metadata_cache
+    
+    def get_all_commands(self) -> list[CommandMetadata]:
+        """获取已注册的全部命令元数据列表。"""
+        return list(self._ensure_cache())
     
     def get_commands_by_group(self, group: str) -> list[CommandMetadata]:
         """按分组名称筛选命令。"""
-        all_commands = self.get_all_commands()
-        return [cmd for cmd in all_commands if cmd.group == group]
+        self._ensure_cache()
+        return list(self._by_group.get(group, ()))
     
     def get_command_tree(self) -> dict[str | None, list[str]]:
         """按分组组织的命令树结构。"""
+        self._ensure_cache()
         tree: dict[str | None, list[str]] = {}
-        for cmd in self.get_all_commands():
-            group = cmd.group or "_ungrouped"
-            if group not in tree:
-                tree[group] = []
-            tree[group].append(cmd.name)
+        for group, commands in self._by_group.items():
+            tree.setdefault(group or "_ungrouped", []).extend(cmd.name for cmd in commands)
         return tree
     
     def search_commands(self, query: str) -> list[CommandMetadata]:
         """按名称或文档关键字模糊搜索命令。"""
         query_lower = query.lower()
-        all_commands = self.get_all_commands()
+        all_commands = self._ensure_cache()
         results = []
         
         for cmd in all_commands:
@@ -54,18 +59,18 @@ class CommandIndex:
         lines = ["# 命令列表\n"]
         
         tree = self.get_command_tree()
-        for group in sorted(tree.keys(), key=lambda x: x or ""):
+        by_name = self._by_name
+        for group in sorted(tree, key=lambda x: x or ""):
             if group == "_ungrouped":
                 lines.append("## 全局命令\n")
             else:
                 lines.append(f"## 组: {group}\n")
             
-            for cmd_name in sorted(tree[group]):
-                cmd = next((c for c in self.get_all_commands() if c.name == cmd_name), None)
-                if cmd:
-                    doc = cmd.docstring or "无文档"
-                    lines.append(f"- **{cmd_name}**: {doc}\n")
-            
+            # 整组一次 extend，每条命令只生成一个字符串
+            lines.extend(
+                f"- **{cmd_name}**: {by_name[cmd_name].docstring or '无文档'}\n"
+                for cmd_name in sorted(tree[group])
+            )
             lines.append("")
         
         return "".join(lines)
@@ -73,6 +78,8 @@ class CommandIndex:
     def _rebuild_cache(self) -> None:
         """重建命令元数据缓存。"""
         self._metadata_cache = []
+        self._by_name = {}
+        self._by_group = {}
         registry = get_registry()
         
         for group, name, func in registry:
@@ -83,3 +90,6 @@ class CommandIndex:
                 module=func.__module__,
             )
             self._metadata_cache.append(metadata)
+            # 同名命令保留首个，与按名称线性查找的结果一致
+            self._by_name.setdefault(name, metadata)
+            self._by_group.setdefault(group, []).append(metadata)
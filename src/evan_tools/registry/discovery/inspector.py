@@ -3,11 +3,24 @@
 负责从可调用对象提取命令元数据，供索引与文档生成使用。
 """
 
+import functools
 import inspect
 import typing as t
 from .metadata import CommandMetadata
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(func: t.Callable[..., None]) -> inspect.Signature:
+    """按函数缓存 inspect.signature 结果，Signature 不可变，可安全共享。"""
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_doc_summary(func: t.Callable[..., None]) -> str | None:
+    """按函数缓存文档字符串摘要。"""
+    return CommandInspector._extract_first_line_of_docstring(func)
+
+
 class CommandInspector:
     """提取并分析命令元数据。"""
     
@@ -29,8 +42,14 @@ class CommandInspector:
         Returns:
             命令元数据对象，包含签名与文档摘要。
         """
-        signature = inspect.signature(func)
-        docstring = self._extract_first_line_of_docstring(func)
+        # 索引重建时同一函数会被反复检查，结果按函数缓存；
+        # 不可哈希的可调用对象直接计算
+        try:
+            signature = _cached_signature(func)
+            docstring = _cached_doc_summary(func)
+        except TypeError:
+            signature = inspect.signature(func)
+            docstring = self._extract_first_line_of_docstring(func)
         
         return CommandMetadata(
             name=name,
@@ -8,7 +8,7 @@ import typing as t
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandMetadata:
     """命令元数据信息，供索引与展示使用。"""
     name: str
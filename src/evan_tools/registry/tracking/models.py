@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionRecord:
     """命令执行审计记录，用于追踪调用历史。"""
     command_name: str
@@ -21,7 +21,7 @@ class ExecutionRecord:
     kwargs: dict[str, t.Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceStats:
     """命令性能统计，记录次数与耗时分布。"""
     command_name: str
@@ -0,0 +1,28 @@
+"""config 测试共用的 fixture"""
+
+import time
+
+import pytest
+
+
+def _wait_for(predicate, timeout=2.0):
+    """轮询直到 predicate 返回 True 或超时"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def wait_for():
+    """等待后台监听线程生效的辅助函数"""
+    return _wait_for
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("db:\n  host: localhost\n  port: 5432\n")
+    return path
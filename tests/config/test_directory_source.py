@@ -0,0 +1,45 @@
+"""DirectoryConfigSource 测试"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from evan_tools.config.sources import DirectoryConfigSource
+
+
+def test_merges_files_in_name_order(tmp_path):
+    for i in range(12):
+        (tmp_path / f"{i:02d}.yaml").write_text(f"value: {i}\nkey{i}: {i}\n")
+
+    config = DirectoryConfigSource().read(tmp_path)
+
+    assert config["value"] == 11
+    assert all(config[f"key{i}"] == i for i in range(12))
+
+
+def test_skips_invalid_files(tmp_path):
+    (tmp_path / "a.yaml").write_text("a: 1\n")
+    (tmp_path / "b.yaml").write_text("b: [unclosed\n")
+    (tmp_path / "c.yml").write_text("c: 3\n")
+
+    assert DirectoryConfigSource().read(tmp_path) == {"a": 1, "c": 3}
+
+
+def test_missing_path_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="not found"):
+        DirectoryConfigSource().read(tmp_path / "missing")
+
+    with pytest.raises(FileNotFoundError, match="not found"):
+        DirectoryConfigSource().read(tmp_path / "missing.yaml")
+
+
+def test_concurrent_reads_share_parse_cache(tmp_path):
+    for i in range(8):
+        (tmp_path / f"{i}.yaml").write_text(f"k{i}: {i}\n")
+    source = DirectoryConfigSource()
+    expected = {f"k{i}": i for i in range(8)}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: source.read(tmp_path), range(16)))
+
+    assert all(result == expected for result in results)
@@ -0,0 +1,140 @@
+"""ConfigManager 测试"""
+
+import os
+import time
+
+import pytest
+
+from evan_tools.config.core import ConfigCache, ConfigManager, ReloadController
+
+
+@pytest.fixture
+def make_manager():
+    """创建 ConfigManager，测试结束时统一 close() 释放监听线程"""
+    managers = []
+
+    def make(**kwargs):
+        manager = ConfigManager(**kwargs)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def test_load_merges_defaults(config_file, make_manager):
+    manager = make_manager()
+
+    manager.load(config_file, default_config={"db": {"user": "admin"}})
+
+    assert manager.get("db") == {"host": "localhost", "port": 5432, "user": "admin"}
+    assert manager.get("missing.key", "fallback") == "fallback"
+
+
+def test_set_publishes_new_snapshot(config_file, make_manager):
+    manager = make_manager()
+    manager.load(config_file)
+    before = manager.get()
+
+    manager.set("db.host", "prod.example.com")
+
+    assert manager.get("db.host") == "prod.example.com"
+    assert before["db"]["host"] == "localhost"
+
+
+def test_reloads_on_file_change(config_file, make_manager, wait_for):
+    manager = make_manager(reload_interval_seconds=0)
+    manager.load(config_file)
+
+    config_file.write_text("db:\n  host: changed\n")
+    later = time.time() + 10
+    os.utime(config_file, (later, later))
+
+    assert wait_for(lambda: manager.get("db.host") == "changed")
+
+
+def test_event_driven_keeps_polling_backstop(config_file, make_manager):
+    controller = ReloadController()
+    manager = make_manager(reload_interval_seconds=0, reload_controller=controller)
+    manager.load(config_file)
+    if controller.is_event_driven:
+        # 模拟网络文件系统上收不到事件的情况
+        controller._watcher._on_change = lambda: None
+
+    config_file.write_text("db:\n  host: changed\n")
+    later = time.time() + 10
+    os.utime(config_file, (later, later))
+
+    assert manager.get("db.host") == "changed"
+
+
+def test_polling_respects_reload_interval(config_file, make_manager):
+    manager = make_manager(
+        cache=ConfigCache(reload_interval_seconds=60),
+        reload_controller=ReloadController(use_inotify=False),
+    )
+    manager.load(config_file)
+
+    config_file.write_text("db:\n  host: changed\n")
+    later = time.time() + 10
+    os.utime(config_file, (later, later))
+
+    assert manager.get("db.host") == "localhost"
+
+
+def test_get_after_initialize_empty_does_not_reload(make_manager):
+    manager = make_manager(reload_interval_seconds=0)
+    manager.initialize_empty()
+
+    assert manager.get("any.key", "default") == "default"
+
+
+def test_repeated_get_is_invalidated_by_new_snapshot(config_file, make_manager):
+    manager = make_manager()
+    manager.load(config_file)
+
+    assert manager.get("db.missing", "a") == "a"
+    assert manager.get("db.missing", "b") == "b"
+    assert manager.get("db.host") == "localhost"
+
+    manager.set("db.host", "prod.example.com")
+    manager.set("db.missing", 1)
+
+    assert manager.get("db.host") == "prod.example.com"
+    assert manager.get("db.missing", "a") == 1
+
+
+def test_list_query_matches_tuple_query(config_file, make_manager):
+    manager = make_manager()
+    manager.load(config_file)
+
+    assert manager.get(["db", "host"]) == "localhost"
+    assert manager.get(["db", "host"]) == manager.get(("db", "host"))
+    assert manager.get(["db", "missing"], "fallback") == "fallback"
+
+
+def test_sync_writes_current_snapshot(config_file, make_manager):
+    manager = make_manager()
+    manager.load(config_file)
+    manager.set("db.host", "synced")
+
+    manager.sync()
+
+    assert make_manager().load(config_file)["db"]["host"] == "synced"
+
+
+def test_unchanged_poll_defers_next_check(config_file, mocker, make_manager):
+    controller = ReloadController(use_inotify=False)
+    manager = make_manager(
+        cache=ConfigCache(reload_interval_seconds=0.05),
+        reload_controller=controller,
+    )
+    manager.load(config_file)
+    spy = mocker.spy(controller, "has_file_changed")
+
+    time.sleep(0.06)
+    for _ in range(100):
+        manager.get("db.host")
+
+    assert spy.call_count == 1
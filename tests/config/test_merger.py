@@ -0,0 +1,40 @@
+"""ConfigMerger 测试"""
+
+from evan_tools.config.core import ConfigMerger
+
+
+def test_nested_dicts_are_merged():
+    base = {"db": {"host": "localhost", "port": 5432}}
+    override = {"db": {"host": "prod.example.com"}}
+
+    assert ConfigMerger.merge(base, override) == {
+        "db": {"host": "prod.example.com", "port": 5432}
+    }
+
+
+def test_later_values_override_earlier():
+    merged = ConfigMerger.merge({"a": 1, "b": {"c": 1}}, {"a": 2}, {"b": 3})
+
+    assert merged == {"a": 2, "b": 3}
+
+
+def test_lists_are_replaced():
+    merged = ConfigMerger.merge({"hosts": ["a", "b", "c"]}, {"hosts": ["x"]})
+
+    assert merged == {"hosts": ["x"]}
+
+
+def test_inputs_are_not_shared_or_mutated():
+    base = {"db": {"host": "localhost"}, "tags": [{"k": "v"}]}
+    override = {"db": {"port": 5432}}
+
+    merged = ConfigMerger.merge(base, override)
+    merged["db"]["host"] = "changed"
+    merged["tags"][0]["k"] = "changed"
+
+    assert base == {"db": {"host": "localhost"}, "tags": [{"k": "v"}]}
+    assert override == {"db": {"port": 5432}}
+
+
+def test_no_configs():
+    assert ConfigMerger.merge() == {}
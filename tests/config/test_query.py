@@ -0,0 +1,94 @@
+"""点号路径查询测试
+
+compile_query/lookup 需要与 pydash.get 在配置数据上的语义保持一致。
+"""
+
+import pydash
+import pytest
+
+from evan_tools.config.core.query import compile_query, copy_tree, lookup, set_path
+
+
+CONFIG = {
+    "db": {"host": "localhost", "ports": [5432, 5433], "replica": None},
+    "servers": [{"name": "a"}, {"name": "b"}],
+    "numbered": {"0": "zero", 1: "one"},
+    "a.b": "dotted",
+}
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "db",
+        "db.host",
+        "db.ports.1",
+        "db.ports.-1",
+        "db.ports[0]",
+        "db.ports.9",
+        "db.replica",
+        "db.replica.x",
+        "servers.1.name",
+        "servers[0].name",
+        "numbered.0",
+        "numbered.1",
+        "a\\.b",
+        "missing.key",
+        "db.host.x",
+    ],
+)
+def test_matches_pydash_get(query):
+    expected = pydash.get(CONFIG, query, "default")
+
+    assert lookup(CONFIG, compile_query(query), "default") == expected
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["", "a", "a.b", "a..b", "a.b.", "a\\.b", "a\\\\.b", "a[0][1].b", "a[-1]",
+     "a[b].c", "a[ 1]", "[0]", "a.[0]", "a[0]b", "a\\[0]"],
+)
+def test_split_path_matches_pydash_to_path(query):
+    assert list(compile_query(query)) == pydash.to_path(query)
+
+
+def test_compile_query_is_cached():
+    assert compile_query("db.host") is compile_query("db.host")
+
+
+def test_lookup_with_key_tuple():
+    assert lookup(CONFIG, ("servers", "1", "name")) == "b"
+    assert lookup(CONFIG, ("db", "nope"), 42) == 42
+
+
+class TestSetPath:
+    """路径复制式写入"""
+
+    def test_sets_nested_value_without_mutating_original(self):
+        original = {"db": {"host": "localhost", "port": 5432}, "cache": {"ttl": 60}}
+
+        updated = set_path(original, compile_query("db.host"), "prod")
+
+        assert updated == {"db": {"host": "prod", "port": 5432}, "cache": {"ttl": 60}}
+        assert original["db"]["host"] == "localhost"
+        assert updated["cache"] is original["cache"]
+
+    def test_creates_missing_containers(self):
+        assert set_path({}, compile_query("a.b"), 1) == {"a": {"b": 1}}
+        assert set_path({}, compile_query("a[0].b"), 1) == {"a": [{"b": 1}]}
+
+    def test_sets_list_items(self):
+        original = {"ports": [1, 2]}
+
+        assert set_path(original, compile_query("ports.1"), 9) == {"ports": [1, 9]}
+        assert set_path(original, compile_query("ports.3"), 9) == {"ports": [1, 2, None, 9]}
+        assert original == {"ports": [1, 2]}
+
+
+def test_copy_tree_shares_no_containers():
+    copied = copy_tree(CONFIG)
+
+    assert copied == CONFIG
+    assert copied["db"] is not CONFIG["db"]
+    assert copied["db"]["ports"] is not CONFIG["db"]["ports"]
+    assert copied["servers"][0] is not CONFIG["servers"][0]
@@ -0,0 +1,149 @@
+"""ReloadController 测试
+
+覆盖 inotify 事件驱动与 mtime 轮询两种变更检测方式。
+"""
+
+import os
+import time
+
+import pytest
+
+from evan_tools.config.core import ReloadController
+from evan_tools.config.core.file_watcher import inotify_available
+
+
+requires_inotify = pytest.mark.skipif(
+    not inotify_available(), reason="inotify is not available"
+)
+
+
+@requires_inotify
+class TestEventDriven:
+    """inotify 事件驱动"""
+
+    def test_detects_write(self, config_file, wait_for):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        try:
+            assert controller.is_event_driven
+            assert not controller.has_file_changed()
+
+            config_file.write_text("a: 2\n")
+
+            assert wait_for(controller.has_file_changed)
+            assert not controller.has_file_changed()
+        finally:
+            controller.close()
+
+    def test_detects_atomic_rename(self, config_file, wait_for):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        try:
+            tmp = config_file.with_name("config.yaml.tmp")
+            tmp.write_text("a: 3\n")
+            os.replace(tmp, config_file)
+
+            assert wait_for(controller.has_file_changed)
+        finally:
+            controller.close()
+
+    def test_ignores_unrelated_files(self, config_file):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        try:
+            (config_file.parent / "other.txt").write_text("x")
+            time.sleep(0.1)
+
+            assert not controller.has_file_changed()
+        finally:
+            controller.close()
+
+    def test_debounces_event_bursts(self, config_file, wait_for):
+        controller = ReloadController(debounce_seconds=0.3)
+        controller.set_config_path(config_file)
+        try:
+            for i in range(5):
+                config_file.write_text(f"a: {i}\n")
+            time.sleep(0.05)
+
+            assert not controller.has_file_changed()
+            assert wait_for(controller.has_file_changed)
+            assert not controller.has_file_changed()
+        finally:
+            controller.close()
+
+    def test_polls_when_events_are_lost(self, config_file):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        try:
+            # 模拟网络文件系统上收不到事件的情况
+            controller._watcher._on_change = lambda: None
+            later = time.time() + 10
+            os.utime(config_file, (later, later))
+
+            assert controller.is_event_driven
+            assert controller.has_file_changed()
+            assert not controller.has_file_changed()
+        finally:
+            controller.close()
+
+    def test_close_releases_watcher(self, config_file):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        watcher = controller._watcher
+
+        controller.close()
+        controller.close()
+
+        assert not controller.is_event_driven
+        assert not watcher._thread.is_alive()
+
+    def test_reset_stops_watching(self, config_file):
+        controller = ReloadController()
+        controller.set_config_path(config_file)
+        controller.reset()
+
+        assert not controller.is_event_driven
+
+
+class TestMtimePolling:
+    """mtime 轮询兜底"""
+
+    def test_detects_mtime_change(self, config_file):
+        controller = ReloadController(use_inotify=False)
+        controller.set_config_path(config_file)
+
+        assert not controller.is_event_driven
+        assert not controller.has_file_changed()
+
+        later = time.time() + 10
+        os.utime(config_file, (later, later))
+
+        assert controller.has_file_changed()
+        assert not controller.has_file_changed()
+
+    def test_detects_deletion(self, config_file):
+        controller = ReloadController(use_inotify=False)
+        controller.set_config_path(config_file)
+
+        config_file.unlink()
+
+        assert controller.has_file_changed()
+
+    def test_detects_in_place_edit_in_directory(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("a: 1\n")
+        (tmp_path / "b.yaml").write_text("b: 1\n")
+        controller = ReloadController(use_inotify=False)
+        controller.set_config_path(tmp_path)
+
+        assert not controller.has_file_changed()
+
+        later = time.time() + 10
+        os.utime(tmp_path / "b.yaml", (later, later))
+
+        assert controller.has_file_changed()
+        assert not controller.has_file_changed()
+
+        (tmp_path / "c.yml").write_text("c: 1\n")
+
+        assert controller.has_file_changed()
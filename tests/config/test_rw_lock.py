@@ -0,0 +1,119 @@
+"""读写锁测试"""
+
+import threading
+import time
+
+import pytest
+
+from evan_tools.config.concurrency import RWLock, ShardedRWLock
+
+
+@pytest.fixture(params=[RWLock, ShardedRWLock])
+def lock(request):
+    return request.param()
+
+
+def test_readers_share_the_lock(lock):
+    inside = threading.Barrier(3, timeout=2)
+
+    def reader():
+        lock.acquire_read()
+        try:
+            inside.wait()
+        finally:
+            lock.release_read()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not inside.broken
+
+
+def test_writer_excludes_readers_and_writers(lock):
+    counter = {"value": 0}
+
+    def writer():
+        for _ in range(200):
+            lock.acquire_write()
+            try:
+                value = counter["value"]
+                time.sleep(0)
+                counter["value"] = value + 1
+            finally:
+                lock.release_write()
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter["value"] == 800
+
+
+def test_waiting_writer_blocks_new_readers():
+    lock = RWLock()
+    lock.acquire_read()
+    order = []
+
+    def writer():
+        lock.acquire_write()
+        order.append("writer")
+        lock.release_write()
+
+    def late_reader():
+        lock.acquire_read()
+        order.append("reader")
+        lock.release_read()
+
+    w = threading.Thread(target=writer)
+    w.start()
+    time.sleep(0.05)
+    r = threading.Thread(target=late_reader)
+    r.start()
+    time.sleep(0.05)
+
+    assert order == []
+    lock.release_read()
+    w.join(timeout=2)
+    r.join(timeout=2)
+
+    assert order == ["writer", "reader"]
+
+
+def test_mixed_readers_and_writers_make_progress(lock):
+    state = {"writing": False, "count": 0}
+    errors = []
+
+    def reader():
+        for _ in range(200):
+            lock.acquire_read()
+            try:
+                if state["writing"]:
+                    errors.append("read during write")
+            finally:
+                lock.release_read()
+
+    def writer():
+        for _ in range(50):
+            lock.acquire_write()
+            try:
+                state["writing"] = True
+                state["count"] += 1
+                state["writing"] = False
+            finally:
+                lock.release_write()
+
+    threads = [threading.Thread(target=reader) for _ in range(6)]
+    threads += [threading.Thread(target=writer) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert not errors
+    assert state["count"] == 150
@@ -0,0 +1,95 @@
+"""YamlConfigSource 测试"""
+
+import os
+
+import yaml
+
+from evan_tools.config.sources import YamlConfigSource
+
+
+def test_reuses_parse_when_unchanged(config_file, mocker):
+    source = YamlConfigSource()
+    spy = mocker.spy(yaml, "load")
+
+    assert source.read(config_file) == {"db": {"host": "localhost", "port": 5432}}
+    assert source.read(config_file) == {"db": {"host": "localhost", "port": 5432}}
+
+    assert spy.call_count == 1
+
+
+def test_touch_without_content_change_skips_parse(config_file, mocker):
+    source = YamlConfigSource()
+    source.read(config_file)
+    spy = mocker.spy(yaml, "load")
+
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert source.read(config_file) == {"db": {"host": "localhost", "port": 5432}}
+    assert spy.call_count == 0
+
+
+def test_reparses_changed_content(config_file):
+    source = YamlConfigSource()
+    source.read(config_file)
+
+    config_file.write_text("db:\n  host: prod.example.com\n")
+
+    assert source.read(config_file) == {"db": {"host": "prod.example.com"}}
+
+
+def test_returned_config_is_independent_copy(config_file):
+    source = YamlConfigSource()
+
+    first = source.read(config_file)
+    first["db"]["host"] = "mutated"
+
+    assert source.read(config_file) == {"db": {"host": "localhost", "port": 5432}}
+
+
+def test_write_round_trips_unicode_and_key_order(tmp_path):
+    source = YamlConfigSource()
+    path = tmp_path / "out.yaml"
+    config = {"名称": "配置", "b": [1, 2], "a": {"z": None, "y": True}}
+
+    source.write(path, config)
+
+    assert path.read_text(encoding="utf-8").startswith("名称: 配置\n")
+    assert list(source.read(path)) == ["名称", "b", "a"]
+    assert source.read(path) == config
+
+
+def test_reads_utf8_content(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_bytes("名称: 配置\n".encode("utf-8"))
+
+    assert YamlConfigSource().read(path) == {"名称": "配置"}
+
+
+def test_write_skips_unchanged_content(tmp_path):
+    source = YamlConfigSource()
+    path = tmp_path / "out.yaml"
+    source.write(path, {"a": 1})
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    source.write(path, {"a": 1})
+    assert path.stat().st_mtime_ns == 1_000_000_000
+
+    source.write(path, {"a": 2})
+    assert path.stat().st_mtime_ns != 1_000_000_000
+    assert source.read(path) == {"a": 2}
+
+
+def test_reads_large_file(tmp_path, mocker):
+    path = tmp_path / "large.yaml"
+    path.write_text("".join(f"key{i}:\n  value: 值{i}\n" for i in range(20000)))
+    source = YamlConfigSource()
+    spy = mocker.spy(yaml, "load")
+
+    config = source.read(path)
+    assert len(config) == 20000
+    assert config["key19999"] == {"value": "值19999"}
+
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert source.read(path) == config
+    assert spy.call_count == 1
@@ -203,3 +203,119 @@ def test_gather_paths_backward_compatibility(temp_dir):
     assert "sub1/nested/f.md" in files
     assert "sub1" in dirs and "sub1/nested" in dirs
     assert py_files == {"b.py", "sub1/e.py"}
+
+
+def test_recursive_does_not_follow_directory_symlinks(temp_dir):
+    root = temp_dir["root"]
+    (root / "link").symlink_to(root / "sub1", target_is_directory=True)
+
+    files = {path.relative_to(root).as_posix() for path in gather_paths([root], deep=True)}
+    dirs = {path.relative_to(root).as_posix() for path in gather_paths([root], deep=True, dir_only=True)}
+
+    assert not any(name.startswith("link/") for name in files)
+    assert "link" in dirs
+    assert not any(name.startswith("link/") for name in dirs)
+
+
+def test_parallel_workers_match_serial_results(temp_dir):
+    root = temp_dir["root"]
+
+    serial = set(PathGatherer([root], deep=True).exclude("nested").gather())
+    parallel = set(PathGatherer([root], deep=True).exclude("nested").workers(4).gather())
+    sorted_gatherer = PathGatherer([root], deep=True).workers(2).sort_by(SortBy.NAME)
+    names = [path.name for path in sorted_gatherer.gather()]
+
+    assert parallel == serial
+    assert names == sorted(names)
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="需要 POSIX 的 RLIMIT_NOFILE")
+def test_parallel_wide_tree_stays_within_fd_limit(tmp_path):
+    resource = pytest.importorskip("resource")
+
+    for i in range(300):
+        sub = tmp_path / f"d{i:03d}"
+        sub.mkdir()
+        (sub / "f.txt").write_text("x")
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # 只比当前已打开的 fd 多留 64 个余量，远少于子目录数
+    limit = len(os.listdir("/dev/fd")) + 64
+    if soft != resource.RLIM_INFINITY and soft <= limit:
+        pytest.skip("当前 fd 上限已低于测试所需")
+
+    gatherer = PathGatherer([tmp_path], deep=True).workers(8)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    try:
+        files = list(gatherer.gather())
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert list(gatherer.errors) == []
+    assert len(files) == 300
+
+
+def test_errors_is_live_read_only_view(temp_dir):
+    root = temp_dir["root"]
+    missing = root / "missing"
+
+    gatherer = PathGatherer([missing, root])
+    errors = gatherer.errors
+    assert errors == []
+
+    list(gatherer.gather())
+
+    assert len(errors) == 1
+    assert errors[0][0] == missing
+    assert isinstance(errors[0][1], FileNotFoundError)
+    assert not hasattr(errors, "append")
+
+
+def test_root_stat_error_keeps_real_cause(temp_dir):
+    root = temp_dir["root"]
+    loop = root / "loop"
+    loop.symlink_to(root / "loop_target")
+    (root / "loop_target").symlink_to(loop)
+
+    gatherer = PathGatherer([loop])
+    list(gatherer.gather())
+
+    [(path, exc)] = gatherer.errors
+    assert path == loop
+    assert isinstance(exc, OSError)
+    assert not isinstance(exc, FileNotFoundError)
+
+
+def test_max_errors_keeps_most_recent(temp_dir):
+    root = temp_dir["root"]
+    missing = [root / f"missing{i}" for i in range(5)]
+
+    gatherer = PathGatherer(missing).max_errors(2)
+    errors = gatherer.errors
+    list(gatherer.gather())
+
+    assert [path for path, _ in errors] == missing[-2:]
+
+
+def test_progress_interval_batches_callbacks(temp_dir):
+    root = temp_dir["root"]
+
+    counts: list[int] = []
+    paths = list(PathGatherer([root], deep=True).on_progress(counts.append, interval=2).gather())
+
+    assert counts[-1] == len(paths)
+    assert all(count % 2 == 0 for count in counts[:-1])
+    assert len(counts) == (len(paths) + 1) // 2
+
+
+def test_as_str_yields_path_strings(temp_dir):
+    root = temp_dir["root"]
+
+    paths = set(PathGatherer([root], deep=True).pattern("*.py").gather())
+    strings = list(PathGatherer([root], deep=True).pattern("*.py").as_str().gather())
+    names = list(PathGatherer([root], deep=True).sort_by(SortBy.NAME).as_str().gather())
+
+    assert all(isinstance(path, str) for path in strings + names)
+    assert {Path(path) for path in strings} == paths
+    keys = [Path(path).name.lower() for path in names]
+    assert keys == sorted(keys)